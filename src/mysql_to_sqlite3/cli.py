@@ -134,6 +134,28 @@ _copyright_header: str = f"mysql2sqlite version {package_version} Copyright (c)
     default=200000,  # this default is here for performance reasons
     help="Chunk reading/writing SQL records",
 )
+@click.option(
+    "--read-workers",
+    type=int,
+    callback=validate_positive_integer,
+    default=0,
+    help="Read table data on this many separate MySQL connections while writing to SQLite. "
+    "Each connection keeps up to two chunks of rows (see --chunk) in memory. "
+    "Defaults to 0, which reads all table data on the main MySQL connection.",
+)
+@click.option(
+    "--exact-count",
+    is_flag=True,
+    help="Count the rows of every table with COUNT(*) instead of using the approximate row counts "
+    "of information_schema for the progress bar.",
+)
+@click.option(
+    "--sqlite-synchronous",
+    type=click.Choice(MySQLtoSQLite.SQLITE_SYNCHRONOUS_MODES, case_sensitive=False),
+    default="NORMAL",
+    help="SQLite synchronous mode used while transferring into a new SQLite database. OFF is the fastest, "
+    "but the SQLite database may be corrupted if the system crashes mid-transfer.",
+)
 @click.option("-l", "--log-file", type=click.Path(), help="Log file")
 @click.option("--json-as-text", is_flag=True, help="Transfer JSON columns as TEXT.")
 @click.option(
@@ -173,6 +195,9 @@ def cli(
     mysql_collation: str,
     skip_ssl: bool,
     chunk: int,
+    read_workers: int,
+    exact_count: bool,
+    sqlite_synchronous: str,
     log_file: t.Union[str, "os.PathLike[t.Any]"],
     json_as_text: bool,
     vacuum: bool,
@@ -221,6 +246,9 @@ def cli(
             mysql_collation=mysql_collation,
             mysql_ssl_disabled=skip_ssl,
             chunk=chunk,
+            read_workers=read_workers,
+            exact_count=exact_count,
+            sqlite_synchronous=sqlite_synchronous,
             json_as_text=json_as_text,
             vacuum=vacuum,
             buffered=use_buffered_cursors,
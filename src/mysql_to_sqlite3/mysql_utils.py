@@ -4,12 +4,99 @@ import typing as t
 
 from mysql.connector import CharacterSet
 from mysql.connector.charsets import MYSQL_CHARACTER_SETS
+from mysql.connector.types import RowItemType
 
 
 CHARSET_INTRODUCERS: t.Tuple[str, ...] = tuple(
     f"_{charset[0]}" for charset in MYSQL_CHARACTER_SETS if charset is not None
 )
 
+MYSQL_TO_SQLITE_TYPES: t.Dict[str, str] = {
+    "BIGINT": "BIGINT",
+    "BINARY": "BLOB",
+    "BIT": "BLOB",
+    "BLOB": "BLOB",
+    "BOOLEAN": "BOOLEAN",
+    "DATE": "DATE",
+    "DATETIME": "DATETIME",
+    "DECIMAL": "DECIMAL",
+    "DOUBLE": "DOUBLE",
+    "FLOAT": "FLOAT",
+    "INT": "INTEGER",
+    "INTEGER": "INTEGER",
+    "LONGBLOB": "BLOB",
+    "MEDIUMBLOB": "BLOB",
+    "MEDIUMINT": "MEDIUMINT",
+    "NUMERIC": "NUMERIC",
+    "REAL": "REAL",
+    "SMALLINT": "SMALLINT",
+    "TIME": "TIME",
+    "TIMESTAMP": "DATETIME",
+    "TINYBLOB": "BLOB",
+    "TINYINT": "TINYINT",
+    "VARBINARY": "BLOB",
+    "YEAR": "YEAR",
+}
+
+MYSQL_BINARY_TYPES: t.FrozenSet[str] = frozenset({"BINARY", "BLOB", "LONGBLOB", "MEDIUMBLOB", "TINYBLOB", "VARBINARY"})
+
+MYSQL_TABLES_QUERY: str = """
+    SELECT TABLE_NAME AS `table`, TABLE_ROWS AS `rows`
+    FROM information_schema.TABLES
+    WHERE TABLE_SCHEMA = %s
+"""
+
+MYSQL_INDICES_QUERY: str = """
+    SELECT s.TABLE_NAME AS `table`,
+        s.INDEX_NAME AS `name`,
+        IF (NON_UNIQUE = 0 AND s.INDEX_NAME = 'PRIMARY', 1, 0) AS `primary`,
+        IF (NON_UNIQUE = 0 AND s.INDEX_NAME <> 'PRIMARY', 1, 0) AS `unique`,
+        MAX(IF (c.EXTRA = 'auto_increment', 1, 0)) AS `auto_increment`,
+        GROUP_CONCAT(s.COLUMN_NAME ORDER BY SEQ_IN_INDEX) AS `columns`,
+        GROUP_CONCAT(c.COLUMN_TYPE ORDER BY SEQ_IN_INDEX) AS `types`
+    FROM information_schema.STATISTICS AS s
+    JOIN information_schema.COLUMNS AS c
+        ON s.TABLE_SCHEMA = c.TABLE_SCHEMA
+        AND s.TABLE_NAME = c.TABLE_NAME
+        AND s.COLUMN_NAME = c.COLUMN_NAME
+    WHERE s.TABLE_SCHEMA = %s
+    GROUP BY s.TABLE_NAME, s.INDEX_NAME, s.NON_UNIQUE
+"""
+
+MYSQL_COLUMN_TYPES_QUERY: str = """
+    SELECT TABLE_NAME AS `table`, DATA_TYPE AS `type`
+    FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = %s
+    AND LOCATE('INVISIBLE', UPPER(EXTRA)) = 0
+    ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
+# {JOIN} is a LEFT JOIN on the MySQL versions that need it
+MYSQL_FOREIGN_KEYS_QUERY: str = """
+    SELECT i.TABLE_NAME AS `table`,
+           k.COLUMN_NAME AS `column`,
+           k.REFERENCED_TABLE_NAME AS `ref_table`,
+           k.REFERENCED_COLUMN_NAME AS `ref_column`,
+           c.UPDATE_RULE AS `on_update`,
+           c.DELETE_RULE AS `on_delete`
+    FROM information_schema.TABLE_CONSTRAINTS AS i
+    {JOIN} information_schema.KEY_COLUMN_USAGE AS k
+        ON i.CONSTRAINT_NAME = k.CONSTRAINT_NAME
+        AND i.TABLE_NAME = k.TABLE_NAME
+    {JOIN} information_schema.REFERENTIAL_CONSTRAINTS AS c
+        ON c.CONSTRAINT_NAME = i.CONSTRAINT_NAME
+        AND c.TABLE_NAME = i.TABLE_NAME
+    WHERE i.TABLE_SCHEMA = %s
+    AND i.CONSTRAINT_TYPE = %s
+    GROUP BY i.TABLE_NAME,
+             i.CONSTRAINT_NAME,
+             k.COLUMN_NAME,
+             k.REFERENCED_TABLE_NAME,
+             k.REFERENCED_COLUMN_NAME,
+             c.UPDATE_RULE,
+             c.DELETE_RULE
+"""
+
 
 class CharSet(t.NamedTuple):
     """MySQL character set as a named tuple."""
@@ -19,6 +106,17 @@ class CharSet(t.NamedTuple):
     collation: str
 
 
+class MySQLIndex(t.NamedTuple):
+    """MySQL index as a named tuple."""
+
+    name: RowItemType
+    primary: RowItemType
+    unique: RowItemType
+    auto_increment: RowItemType
+    columns: RowItemType
+    types: RowItemType
+
+
 def mysql_supported_character_sets(charset: t.Optional[str] = None) -> t.Iterator[CharSet]:
     """Get supported MySQL character sets."""
     index: int
@@ -1,5 +1,6 @@
 """SQLite adapters and converters for unsupported data types."""
 
+import re
 import sqlite3
 import typing as t
 from datetime import date, timedelta
@@ -10,6 +11,10 @@ from dateutil.parser import parse as dateutil_parse
 from pytimeparse2 import parse
 
 
+TIME_PATTERN: t.Pattern[str] = re.compile(r"^(\d+):(\d{2}):(\d{2})$")
+SQLITE_PRAGMA_VALUE_PATTERN: t.Pattern[str] = re.compile(r"[\w-]+")
+
+
 def adapt_decimal(value: t.Any) -> str:
     """Convert decimal.Decimal to string."""
     return str(value)
@@ -17,27 +22,60 @@ def adapt_decimal(value: t.Any) -> str:
 
 def convert_decimal(value: t.Any) -> Decimal:
     """Convert string to decimal.Decimal."""
-    return Decimal(value)
+    # SQLite hands converters bytes, which Decimal does not accept
+    return Decimal(value.decode() if isinstance(value, bytes) else value)
 
 
 def adapt_timedelta(value: t.Any) -> str:
     """Convert datetime.timedelta to %H:%M:%S string."""
-    hours, remainder = divmod(value.total_seconds(), 3600)
+    hours, remainder = divmod(value.days * 86400 + value.seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
-    return "{:02}:{:02}:{:02}".format(int(hours), int(minutes), int(seconds))
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
 def convert_timedelta(value: t.Any) -> timedelta:
     """Convert %H:%M:%S string to datetime.timedelta."""
-    return timedelta(seconds=parse(value))
+    _value: str = value.decode() if isinstance(value, bytes) else value
+    match: t.Optional[t.Match[str]] = TIME_PATTERN.match(_value)
+    if match:
+        return timedelta(hours=int(match.group(1)), minutes=int(match.group(2)), seconds=int(match.group(3)))
+    return timedelta(seconds=parse(_value))
 
 
 def encode_data_for_sqlite(value: t.Any) -> t.Any:
     """Fix encoding bytes."""
-    try:
-        return value.decode()
-    except (UnicodeDecodeError, AttributeError):
-        return sqlite3.Binary(value)
+    if isinstance(value, (bytes, bytearray)):
+        try:
+            return value.decode()
+        except UnicodeDecodeError:
+            return sqlite3.Binary(value)
+    return value
+
+
+def check_sqlite_pragmas(pragmas: t.Mapping[str, str], supported: t.Collection[str]) -> None:
+    """Reject unsupported SQLite pragmas and values that are not a plain word or number."""
+    # the pragmas are interpolated into the statements, so only accept known names and plain values
+    for name, value in pragmas.items():
+        if name not in supported:
+            raise ValueError(f'"{name}" is not a supported SQLite pragma! Use one of {", ".join(supported)}.')
+        if not SQLITE_PRAGMA_VALUE_PATTERN.fullmatch(value):
+            raise ValueError(f'"{value}" is not a valid value for the SQLite pragma {name}!')
+
+
+def set_sqlite_pragmas(cursor: sqlite3.Cursor, pragmas: t.Mapping[str, str]) -> None:
+    """Apply SQLite pragmas, page_size and journal_mode first and on their own."""
+    remaining: t.Dict[str, str] = dict(pragmas)
+    # the page size can only change before the first table exists
+    page_size: t.Optional[str] = remaining.pop("page_size", None)
+    if page_size is not None:
+        cursor.execute(f"PRAGMA page_size={page_size}")
+    # journal_mode reports back the mode it switched to, so set it on its own
+    journal_mode: t.Optional[str] = remaining.pop("journal_mode", None)
+    if journal_mode is not None:
+        cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+        cursor.fetchall()
+    if remaining:
+        cursor.executescript("".join(f"PRAGMA {name}={value};" for name, value in remaining.items()))
 
 
 class CollatingSequences:
@@ -50,8 +88,15 @@ class CollatingSequences:
 
 def convert_date(value: t.Union[str, bytes]) -> date:
     """Handle SQLite date conversion."""
+    _value: str = value.decode() if isinstance(value, bytes) else value
+    # only a bare YYYY-MM-DD takes the fast path, anything longer is left to dateutil to accept or reject
+    if len(_value) == 10:
+        try:
+            return date.fromisoformat(_value)
+        except ValueError:
+            pass
     try:
-        return dateutil_parse(value.decode() if isinstance(value, bytes) else value).date()
+        return dateutil_parse(_value).date()
     except ParserError as err:
         raise ValueError(f"DATE field contains {err}")  # pylint: disable=W0707
 
@@ -0,0 +1,131 @@
+"""Read MySQL table data on worker threads while the SQLite writer consumes it."""
+
+import logging
+import queue
+import threading
+import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import mysql.connector
+from mysql.connector import errorcode
+from mysql.connector.abstracts import MySQLConnectionAbstract
+
+
+class TableReaders:
+    """Stream the data of MySQL tables through bounded queues, one worker connection per table.
+
+    A worker that loses its MySQL connection before handing any rows to the writer reconnects and
+    reads the table again once. Losing it later fails the transfer instead of retrying.
+
+    Every worker holds at most two chunks of rows in memory, the one waiting for the writer and the
+    one it is reading, so the memory used grows with both the number of workers and the fetch size.
+    """
+
+    QUEUE_SIZE: int = 1
+
+    def __init__(
+        self,
+        connect: t.Callable[[], MySQLConnectionAbstract],
+        database: str,
+        workers: int,
+        fetch_size: int,
+        encode_rows: t.Callable[[str, t.Iterable[t.Iterable[t.Any]]], t.List[t.Tuple[t.Any, ...]]],
+        limit_rows: int = 0,
+        logger: t.Optional[logging.Logger] = None,
+    ) -> None:
+        """Constructor."""
+        self._connect = connect
+        self._database = database
+        self._fetch_size = fetch_size
+        self._encode_rows = encode_rows
+        self._limit_rows = limit_rows
+        self._logger = logger or logging.getLogger(self.__class__.__name__)
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._stop = threading.Event()
+        self._queues: t.Dict[str, "queue.Queue[t.Any]"] = {}
+        self._futures: t.List["Future[None]"] = []
+
+    def __contains__(self, table_name: object) -> bool:
+        """Check whether a table is being read by the workers."""
+        return table_name in self._queues
+
+    def start(self, tables: t.Iterable[str]) -> None:
+        """Queue up the tables, the workers read them in the given order."""
+        for table_name in tables:
+            # a single chunk per table waits for the writer, a table read ahead of it only leaves its end marker
+            self._queues[table_name] = queue.Queue(maxsize=self.QUEUE_SIZE)
+            self._futures.append(self._executor.submit(self._read_table, table_name, self._queues[table_name]))
+
+    def columns(self, table_name: str) -> t.Tuple[str, ...]:
+        """Wait for the column names of a table, they always precede its rows."""
+        return t.cast(t.Tuple[str, ...], self._get(table_name))
+
+    def chunks(self, table_name: str) -> t.Iterator[t.List[t.Tuple[t.Any, ...]]]:
+        """Yield the encoded rows of a table chunk by chunk until it is exhausted."""
+        return iter(lambda: self._get(table_name), None)
+
+    def close(self) -> None:
+        """Stop all the workers and wait for them to release their connections."""
+        self._stop.set()
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+
+    def _get(self, table_name: str) -> t.Any:
+        item: t.Any = self._queues[table_name].get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def _put(self, chunks: "queue.Queue[t.Any]", item: t.Any) -> None:
+        while not self._stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _read_table(self, table_name: str, chunks: "queue.Queue[t.Any]") -> None:
+        columns_sent: bool = False
+        rows_sent: bool = False
+        for attempt in range(2):
+            connection: t.Optional[MySQLConnectionAbstract] = None
+            try:
+                connection = self._connect()
+                connection.database = self._database
+                # unbuffered, so only the chunks waiting in the queue are held in memory
+                cursor = connection.cursor(raw=True)
+                cursor.execute(
+                    "SELECT * FROM `{table_name}` {limit}".format(
+                        table_name=table_name,
+                        limit=f"LIMIT {self._limit_rows}" if self._limit_rows > 0 else "",
+                    )
+                )
+                if not columns_sent:
+                    self._put(chunks, tuple(column[0] for column in cursor.description))  # type: ignore[union-attr]
+                    columns_sent = True
+                while not self._stop.is_set():
+                    rows = cursor.fetchmany(self._fetch_size)
+                    if not rows:
+                        break
+                    self._put(chunks, self._encode_rows(table_name, rows))
+                    rows_sent = True
+                self._put(chunks, None)
+                return
+            except mysql.connector.Error as err:
+                # reading the table again is only safe while the writer has not received any of its rows,
+                # a plain SELECT has no stable order to resume from and would insert the same rows twice
+                if err.errno == errorcode.CR_SERVER_LOST and attempt == 0 and not rows_sent:
+                    self._logger.warning("Connection to MySQL server lost.\nAttempting to reconnect.")
+                    continue
+                self._put(chunks, err)
+                return
+            except Exception as err:  # pylint: disable=W0718
+                self._put(chunks, err)
+                return
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except mysql.connector.Error:
+                        pass
@@ -5,30 +5,46 @@ import os
 import re
 import sqlite3
 import typing as t
+from collections import defaultdict
 from datetime import timedelta
 from decimal import Decimal
+from functools import lru_cache
+from itertools import chain
 from math import ceil
 from os.path import realpath
-from sys import stdout
+from sys import intern, stdout, version_info
 
 import mysql.connector
 import typing_extensions as tx
 from mysql.connector import CharacterSet, errorcode
 from mysql.connector.abstracts import MySQLConnectionAbstract
+from mysql.connector.cursor import MySQLCursorDict
 from mysql.connector.types import RowItemType
-from tqdm import tqdm, trange
-
-from mysql_to_sqlite3.mysql_utils import CHARSET_INTRODUCERS
+from tqdm import tqdm
+
+from mysql_to_sqlite3.mysql_utils import (
+    CHARSET_INTRODUCERS,
+    MYSQL_BINARY_TYPES,
+    MYSQL_COLUMN_TYPES_QUERY,
+    MYSQL_FOREIGN_KEYS_QUERY,
+    MYSQL_INDICES_QUERY,
+    MYSQL_TABLES_QUERY,
+    MYSQL_TO_SQLITE_TYPES,
+    MySQLIndex,
+)
 from mysql_to_sqlite3.sqlite_utils import (
     CollatingSequences,
     Integer_Types,
     adapt_decimal,
     adapt_timedelta,
+    check_sqlite_pragmas,
     convert_date,
     convert_decimal,
     convert_timedelta,
     encode_data_for_sqlite,
+    set_sqlite_pragmas,
 )
+from mysql_to_sqlite3.table_readers import TableReaders
 from mysql_to_sqlite3.types import MySQLtoSQLiteAttributes, MySQLtoSQLiteParams
 
 
@@ -37,6 +53,36 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
 
     COLUMN_PATTERN: t.Pattern[str] = re.compile(r"^[^(]+")
     COLUMN_LENGTH_PATTERN: t.Pattern[str] = re.compile(r"\(\d+\)$")
+    # longest introducers first, so _utf8mb4 is not mistaken for _utf8
+    CHARSET_INTRODUCER_PATTERN: t.Pattern[str] = re.compile(
+        r"^(?P<introducer>{introducers})\s*(?:(?P<prefix>[BbXx])(?=\\?'))?(?P<value>.*)$".format(
+            introducers="|".join(map(re.escape, sorted(CHARSET_INTRODUCERS, key=len, reverse=True)))
+        ),
+        re.DOTALL,
+    )
+    CHARSET_INTRODUCER_BYTES_PATTERN: t.Pattern[bytes] = re.compile(
+        CHARSET_INTRODUCER_PATTERN.pattern.encode(), re.DOTALL
+    )
+    MYSQL_COUNT_BATCH_SIZE: int = 64
+    MYSQL_FETCH_SIZE: int = 10000
+    SQLITE_BOOLEAN_LITERALS: bool = sqlite3.sqlite_version_info >= (3, 23, 0)
+    SQLITE_CACHED_STATEMENTS: int = 1024
+    SQLITE_INSERT_BATCH_SIZE: int = 500
+    # the lowest limit SQLite has ever been built with, used when the library cannot be asked for its own
+    SQLITE_MAX_VARIABLE_NUMBER: int = 999
+    SQLITE_PRAGMAS: t.Dict[str, str] = {
+        "page_size": "32768",
+        "journal_mode": "MEMORY",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "cache_size": "-131072",
+        "mmap_size": "268435456",
+    }
+    # pragmas that change the file layout or trade crash safety for speed, an existing database keeps its own
+    SQLITE_NEW_DATABASE_PRAGMAS: t.FrozenSet[str] = frozenset({"page_size", "journal_mode", "synchronous"})
+    SQLITE_SYNCHRONOUS_MODES: t.Tuple[str, ...] = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+    _sqlite_json1_extension_support: t.ClassVar[t.Dict[str, bool]] = {}
 
     def __init__(self, **kwargs: tx.Unpack[MySQLtoSQLiteParams]) -> None:
         """Constructor."""
@@ -104,10 +150,22 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
 
         self._current_chunk_number = 0
 
+        self._mysql_schema_prefetched = False
+
+        self._mysql_columns = {}
+
+        self._mysql_binary_columns = {}
+
+        self._sqlite_deferred_indices = {}
+
         self._chunk_size = kwargs.get("chunk") or None
 
         self._buffered = bool(kwargs.get("buffered", False))
 
+        self._exact_count = bool(kwargs.get("exact_count", False))
+
+        self._read_workers = kwargs.get("read_workers") or 0
+
         self._vacuum = bool(kwargs.get("vacuum", False))
 
         self._quiet = bool(kwargs.get("quiet", False))
@@ -115,38 +173,63 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
         self._logger = self._setup_logger(log_file=kwargs.get("log_file") or None, quiet=self._quiet)
 
         sqlite3.register_adapter(Decimal, adapt_decimal)
-        sqlite3.register_converter("DECIMAL", convert_decimal)
         sqlite3.register_adapter(timedelta, adapt_timedelta)
+        # the transfer never reads rows back, but callers reading the result with PARSE_DECLTYPES rely on these
+        sqlite3.register_converter("DECIMAL", convert_decimal)
         sqlite3.register_converter("DATE", convert_date)
         sqlite3.register_converter("TIME", convert_timedelta)
 
-        self._sqlite = sqlite3.connect(realpath(self._sqlite_file), detect_types=sqlite3.PARSE_DECLTYPES)
-        self._sqlite.row_factory = sqlite3.Row
+        self._sqlite_pragmas = {
+            name: str(value) for name, value in {**self.SQLITE_PRAGMAS, **(kwargs.get("sqlite_pragmas") or {})}.items()
+        }
+        if kwargs.get("sqlite_synchronous") is not None:
+            # synchronous=OFF is only safe if a crashed transfer is simply run again
+            self._sqlite_pragmas["synchronous"] = str(kwargs.get("sqlite_synchronous"))
+        if self._sqlite_pragmas["synchronous"].upper() not in self.SQLITE_SYNCHRONOUS_MODES:
+            raise ValueError(
+                f'"{self._sqlite_pragmas["synchronous"]}" is not a valid SQLite synchronous mode! '
+                f'Use one of {", ".join(self.SQLITE_SYNCHRONOUS_MODES)}.'
+            )
+        self._sqlite_pragmas["synchronous"] = self._sqlite_pragmas["synchronous"].upper()
+        check_sqlite_pragmas(self._sqlite_pragmas, self.SQLITE_PRAGMAS)
+
+        # connecting creates the file, so check for an existing database first
+        new_database: bool = not os.path.isfile(self._sqlite_file) or os.path.getsize(self._sqlite_file) == 0
+
+        self._sqlite = sqlite3.connect(
+            realpath(self._sqlite_file),
+            isolation_level=None,
+            # keep every table's CREATE and INSERT statements prepared for the whole transfer
+            cached_statements=self.SQLITE_CACHED_STATEMENTS,
+        )
 
         self._sqlite_cur = self._sqlite.cursor()
 
+        # the host parameter limit is set when SQLite is compiled and distributions often lower it
+        if version_info >= (3, 11):
+            self._sqlite_max_variable_number = self._sqlite.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        else:
+            self._sqlite_max_variable_number = self.SQLITE_MAX_VARIABLE_NUMBER
+
+        # an existing database keeps its own page size, journal and synchronous mode
+        set_sqlite_pragmas(
+            self._sqlite_cur,
+            {
+                name: value
+                for name, value in self._sqlite_pragmas.items()
+                if new_database or name not in self.SQLITE_NEW_DATABASE_PRAGMAS
+            },
+        )
+
         self._json_as_text = bool(kwargs.get("json_as_text", False))
 
         self._sqlite_json1_extension_enabled = not self._json_as_text and self._check_sqlite_json1_extension_enabled()
 
         try:
-            _mysql_connection = mysql.connector.connect(
-                user=self._mysql_user,
-                password=self._mysql_password,
-                host=self._mysql_host,
-                port=self._mysql_port,
-                ssl_disabled=self._mysql_ssl_disabled,
-                charset=self._mysql_charset,
-                collation=self._mysql_collation,
-            )
-            if isinstance(_mysql_connection, MySQLConnectionAbstract):
-                self._mysql = _mysql_connection
-            else:
-                raise ConnectionError("Unable to connect to MySQL")
-            if not self._mysql.is_connected():
-                raise ConnectionError("Unable to connect to MySQL")
-
-            self._mysql_cur = self._mysql.cursor(buffered=self._buffered, raw=True)  # type: ignore[assignment]
+            self._mysql = self._connect_to_mysql()
+
+            # table data is always streamed, buffering only applies to the schema queries
+            self._mysql_cur = self._mysql.cursor(buffered=False, raw=True)  # type: ignore[assignment]
             self._mysql_cur_prepared = self._mysql.cursor(prepared=True)  # type: ignore[assignment]
             self._mysql_cur_dict = self._mysql.cursor(  # type: ignore[assignment]
                 buffered=self._buffered,
@@ -160,10 +243,33 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
                     raise
                 self._logger.error(err)
                 raise
+
+            server_version: t.Optional[t.Tuple[int, ...]] = self._mysql.get_server_version()
+            self._mysql_foreign_keys_join = (
+                "JOIN"
+                if (server_version is not None and server_version[0] == 8 and server_version[2] > 19)
+                else "LEFT JOIN"
+            )
         except mysql.connector.Error as err:
             self._logger.error(err)
             raise
 
+    def _connect_to_mysql(self) -> MySQLConnectionAbstract:
+        connection = mysql.connector.connect(
+            user=self._mysql_user,
+            password=self._mysql_password,
+            host=self._mysql_host,
+            port=self._mysql_port,
+            ssl_disabled=self._mysql_ssl_disabled,
+            charset=self._mysql_charset,
+            collation=self._mysql_collation,
+        )
+        if not isinstance(connection, MySQLConnectionAbstract):
+            raise ConnectionError("Unable to connect to MySQL")
+        if not connection.is_connected():
+            raise ConnectionError("Unable to connect to MySQL")
+        return connection
+
     @classmethod
     def _setup_logger(
         cls, log_file: t.Optional[t.Union[str, "os.PathLike[t.Any]"]] = None, quiet: bool = False
@@ -198,19 +304,20 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
         return ""
 
     @staticmethod
-    def _decode_column_type(column_type: t.Union[str, bytes]) -> str:
+    def _decode_column_type(column_type: t.Union[str, bytes, bytearray]) -> str:
         if isinstance(column_type, str):
             return column_type
-        if isinstance(column_type, bytes):
+        if isinstance(column_type, (bytes, bytearray)):
             try:
                 return column_type.decode()
-            except (UnicodeDecodeError, AttributeError):
-                pass
+            except UnicodeDecodeError:
+                # latin-1 maps every byte, unlike str() which would return the "b'...'" repr
+                return column_type.decode("latin-1")
         return str(column_type)
 
     @classmethod
     def _translate_type_from_mysql_to_sqlite(
-        cls, column_type: t.Union[str, bytes], sqlite_json1_extension_enabled=False
+        cls, column_type: t.Union[str, bytes, bytearray], sqlite_json1_extension_enabled=False
     ) -> str:
         _column_type: str = cls._decode_column_type(column_type)
 
@@ -219,47 +326,23 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
         if not match:
             raise ValueError(f'"{_column_type}" is not a valid column_type!')
 
-        data_type: str = match.group(0).upper()
+        # raw column types can be unhashable bytearrays, so only the decoded type is cached
+        return cls._translate_data_type_to_sqlite(match.group(0).upper(), _column_type, sqlite_json1_extension_enabled)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _translate_data_type_to_sqlite(
+        cls, data_type: str, column_type: str, sqlite_json1_extension_enabled: bool = False
+    ) -> str:
 
         if data_type.endswith(" UNSIGNED"):
             data_type = data_type.replace(" UNSIGNED", "")
 
-        if data_type in {
-            "BIGINT",
-            "BLOB",
-            "BOOLEAN",
-            "DATE",
-            "DATETIME",
-            "DECIMAL",
-            "DOUBLE",
-            "FLOAT",
-            "INTEGER",
-            "MEDIUMINT",
-            "NUMERIC",
-            "REAL",
-            "SMALLINT",
-            "TIME",
-            "TINYINT",
-            "YEAR",
-        }:
-            return data_type
-        if data_type in {
-            "BIT",
-            "BINARY",
-            "LONGBLOB",
-            "MEDIUMBLOB",
-            "TINYBLOB",
-            "VARBINARY",
-        }:
-            return "BLOB"
-        if data_type in {"NCHAR", "NVARCHAR", "VARCHAR"}:
-            return data_type + cls._column_type_length(_column_type)
-        if data_type == "CHAR":
-            return "CHARACTER" + cls._column_type_length(_column_type)
-        if data_type == "INT":
-            return "INTEGER"
-        if data_type in "TIMESTAMP":
-            return "DATETIME"
+        sqlite_type: t.Optional[str] = MYSQL_TO_SQLITE_TYPES.get(data_type)
+        if sqlite_type is not None:
+            return sqlite_type
+        if data_type in {"CHAR", "NCHAR", "NVARCHAR", "VARCHAR"}:
+            return intern(("CHARACTER" if data_type == "CHAR" else data_type) + cls._column_type_length(column_type))
         if data_type == "JSON" and sqlite_json1_extension_enabled:
             return "JSON"
         return "TEXT"
@@ -271,8 +354,6 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
         column_type: t.Optional[str] = None,
         column_extra: RowItemType = None,
     ) -> str:
-        is_binary: bool
-        is_hex: bool
         if isinstance(column_default, bytes):
             if column_type in {
                 "BIT",
@@ -284,33 +365,15 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
                 "VARBINARY",
             }:
                 if column_extra in {"DEFAULT_GENERATED", "default_generated"}:
-                    for charset_introducer in CHARSET_INTRODUCERS:
-                        if column_default.startswith(charset_introducer.encode()):
-                            is_binary = False
-                            is_hex = False
-                            for b_prefix in ("B", "b"):
-                                if column_default.startswith(rf"{charset_introducer} {b_prefix}\'".encode()):
-                                    is_binary = True
-                                    break
-                            for x_prefix in ("X", "x"):
-                                if column_default.startswith(rf"{charset_introducer} {x_prefix}\'".encode()):
-                                    is_hex = True
-                                    break
-                            column_default = (
-                                column_default.replace(charset_introducer.encode(), b"")
-                                .replace(rb"x\'", b"")
-                                .replace(rb"X\'", b"")
-                                .replace(rb"b\'", b"")
-                                .replace(rb"B\'", b"")
-                                .replace(rb"\'", b"")
-                                .replace(rb"'", b"")
-                                .strip()
-                            )
-                            if is_binary:
-                                return f"DEFAULT '{chr(int(column_default, 2))}'"
-                            if is_hex:
-                                return f"DEFAULT x'{column_default.decode()}'"
-                            break
+                    introduced_bytes: t.Optional[t.Match[bytes]] = cls.CHARSET_INTRODUCER_BYTES_PATTERN.match(
+                        column_default
+                    )
+                    if introduced_bytes:
+                        column_default = introduced_bytes.group("value").replace(rb"\'", b"").replace(b"'", b"").strip()
+                        if introduced_bytes.group("prefix") in {b"B", b"b"}:
+                            return f"DEFAULT '{chr(int(column_default, 2))}'"
+                        if introduced_bytes.group("prefix") in {b"X", b"x"}:
+                            return f"DEFAULT x'{column_default.decode()}'"
                 return f"DEFAULT x'{column_default.hex()}'"
             try:
                 column_default = column_default.decode()
@@ -319,7 +382,7 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
         if column_default is None:
             return ""
         if isinstance(column_default, bool):
-            if column_type == "BOOLEAN" and sqlite3.sqlite_version >= "3.23.0":
+            if column_type == "BOOLEAN" and cls.SQLITE_BOOLEAN_LITERALS:
                 if column_default:
                     return "DEFAULT(TRUE)"
                 return "DEFAULT(FALSE)"
@@ -332,37 +395,24 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
                     "CURRENT_TIMESTAMP",
                 }:
                     return f"DEFAULT {column_default.upper()}"
-                for charset_introducer in CHARSET_INTRODUCERS:
-                    if column_default.startswith(charset_introducer):
-                        is_binary = False
-                        is_hex = False
-                        for b_prefix in ("B", "b"):
-                            if column_default.startswith(rf"{charset_introducer} {b_prefix}\'"):
-                                is_binary = True
-                                break
-                        for x_prefix in ("X", "x"):
-                            if column_default.startswith(rf"{charset_introducer} {x_prefix}\'"):
-                                is_hex = True
-                                break
-                        column_default = (
-                            column_default.replace(charset_introducer, "")
-                            .replace(r"x\'", "")
-                            .replace(r"X\'", "")
-                            .replace(r"b\'", "")
-                            .replace(r"B\'", "")
-                            .replace(r"\'", "")
-                            .replace(r"'", "")
-                            .strip()
-                        )
-                        if is_binary:
-                            return f"DEFAULT '{chr(int(column_default, 2))}'"
-                        if is_hex:
-                            return f"DEFAULT x'{column_default}'"
-                        return f"DEFAULT '{column_default}'"
+                introduced: t.Optional[t.Match[str]] = cls.CHARSET_INTRODUCER_PATTERN.match(column_default)
+                if introduced:
+                    column_default = introduced.group("value").replace(r"\'", "").replace("'", "").strip()
+                    if introduced.group("prefix") in {"B", "b"}:
+                        return f"DEFAULT '{chr(int(column_default, 2))}'"
+                    if introduced.group("prefix") in {"X", "x"}:
+                        return f"DEFAULT x'{column_default}'"
+                    return f"DEFAULT '{column_default}'"
             return "DEFAULT '{}'".format(column_default.replace(r"\'", r"''"))
         return "DEFAULT '{}'".format(str(column_default).replace(r"\'", r"''"))
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _quote_sqlite_identifier(identifier: str) -> str:
+        return '"{}"'.format(identifier.replace('"', '""'))
+
     @classmethod
+    @lru_cache(maxsize=4096)
     def _data_type_collation_sequence(
         cls, collation: str = CollatingSequences.BINARY, column_type: t.Optional[str] = None
     ) -> str:
@@ -380,115 +430,237 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
         return ""
 
     def _check_sqlite_json1_extension_enabled(self) -> bool:
+        # the compile options belong to the SQLite library, so they only need to be read once per process
+        enabled: t.Optional[bool] = self._sqlite_json1_extension_support.get(sqlite3.sqlite_version)
+        if enabled is None:
+            try:
+                self._sqlite_cur.execute("PRAGMA compile_options")
+                enabled = any(row[0] == "ENABLE_JSON1" for row in self._sqlite_cur)
+            except sqlite3.Error:
+                return False
+            self._sqlite_json1_extension_support[sqlite3.sqlite_version] = enabled
+        return enabled
+
+    def _count_table_rows(self, table_names: t.Sequence[str]) -> t.Dict[str, int]:
+        counts: t.Dict[str, int] = {}
+        # a limited subquery stops reading a table after the limit instead of counting all of its rows
+        source: str = (
+            f"(SELECT 1 FROM `{{table_name}}` LIMIT {self._limit_rows}) AS `table`"
+            if self._limit_rows > 0
+            else "`{table_name}`"
+        )
+        for offset in range(0, len(table_names), self.MYSQL_COUNT_BATCH_SIZE):
+            batch: t.Sequence[str] = table_names[offset : offset + self.MYSQL_COUNT_BATCH_SIZE]
+            self._mysql_cur_dict.execute(
+                " UNION ALL ".join(
+                    f"SELECT {position} AS `position`, COUNT(*) AS `total_records` "
+                    f"FROM {source.format(table_name=table_name)}"
+                    for position, table_name in enumerate(batch)
+                )
+            )
+            for row in self._mysql_cur_dict.fetchall():
+                if row is not None:
+                    counts[batch[int(row["position"])]] = int(row["total_records"])  # type: ignore[arg-type]
+        return counts
+
+    def _prefetch_mysql_schema(self) -> None:
+        self._mysql_table_names = set()
+        self._mysql_table_rows = {}
+        self._mysql_indices = defaultdict(list)
+        self._mysql_foreign_keys = defaultdict(list)
+
+        # each result set is read exactly once, so skip the extra client side buffering
+        cursor: MySQLCursorDict = t.cast(MySQLCursorDict, self._mysql.cursor(dictionary=True, buffered=False))
+        # there can be thousands of indices, so read them as plain tuples instead of dicts
+        index_cursor = self._mysql.cursor(buffered=False)
         try:
-            self._sqlite_cur.execute("PRAGMA compile_options")
-            return "ENABLE_JSON1" in set(row[0] for row in self._sqlite_cur.fetchall())
-        except sqlite3.Error:
-            return False
+            cursor.execute(MYSQL_TABLES_QUERY, (self._mysql_database,))
+            rows: t.Sequence[t.Optional[t.Dict[str, RowItemType]]] = cursor.fetchall()
+            for row in rows:
+                if row is not None:
+                    name: str = self._decode_column_type(row["table"])  # type: ignore[arg-type]
+                    self._mysql_table_names.add(name.lower())
+                    self._mysql_table_rows[name] = int(row["rows"] or 0)  # type: ignore[arg-type]
+
+            index_cursor.execute(MYSQL_INDICES_QUERY, (self._mysql_database,))
+            for index_row in t.cast(t.List[t.Tuple[RowItemType, ...]], index_cursor.fetchall()):
+                if index_row is not None:
+                    self._mysql_indices[self._decode_column_type(index_row[0])].append(  # type: ignore[arg-type]
+                        MySQLIndex(*index_row[1:])
+                    )
+
+            # SELECT * leaves out invisible columns, so number the visible ones in the order it returns them
+            index_cursor.execute(MYSQL_COLUMN_TYPES_QUERY, (self._mysql_database,))
+            positions: t.Dict[str, int] = defaultdict(int)
+            binary_columns: t.Dict[str, t.Set[int]] = defaultdict(set)
+            for column_row in t.cast(t.List[t.Tuple[RowItemType, ...]], index_cursor.fetchall()):
+                column_table: str = self._decode_column_type(column_row[0])  # type: ignore[arg-type]
+                if self._decode_column_type(column_row[1]).upper() in MYSQL_BINARY_TYPES:  # type: ignore[arg-type]
+                    binary_columns[column_table].add(positions[column_table])
+                positions[column_table] += 1
+            self._mysql_binary_columns = {table: frozenset(columns) for table, columns in binary_columns.items()}
+
+            if not self._without_tables and not self._without_foreign_keys:
+                cursor.execute(
+                    MYSQL_FOREIGN_KEYS_QUERY.format(JOIN=self._mysql_foreign_keys_join),
+                    (self._mysql_database, "FOREIGN KEY"),
+                )
+                rows = cursor.fetchall()
+                for row in rows:
+                    if row is not None:
+                        table: str = self._decode_column_type(row.pop("table"))  # type: ignore[arg-type]
+                        self._mysql_foreign_keys[table].append(row)
+        finally:
+            index_cursor.close()
+            cursor.close()
+
+        self._mysql_schema_prefetched = True
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _build_insert_sql(cls, table_name: str, columns: t.Tuple[str, ...], or_ignore: bool = True) -> str:
+        return "{insert} INTO {table} ({fields}) VALUES ({placeholders})".format(
+            insert="INSERT OR IGNORE" if or_ignore else "INSERT",
+            table=cls._quote_sqlite_identifier(table_name),
+            fields=", ".join(cls._quote_sqlite_identifier(column) for column in columns),
+            placeholders=", ".join("?" * len(columns)),
+        )
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _build_multi_row_insert_sql(
+        cls, sql: str, max_variable_number: int = SQLITE_MAX_VARIABLE_NUMBER
+    ) -> t.Tuple[int, str]:
+        statement, _, placeholders = sql.rpartition(" VALUES ")
+        rows: int = max(
+            1,
+            min(cls.SQLITE_INSERT_BATCH_SIZE, max_variable_number // max(1, placeholders.count("?"))),
+        )
+        return rows, "{statement} VALUES {values}".format(statement=statement, values=", ".join([placeholders] * rows))
 
-    def _build_create_table_sql(self, table_name: str) -> str:
-        sql: str = f'CREATE TABLE IF NOT EXISTS "{table_name}" ('
-        primary: str = ""
-        indices: str = ""
+    @staticmethod
+    def _encode_rows(
+        rows: t.Iterable[t.Iterable[t.Any]], binary_columns: t.FrozenSet[int] = frozenset()
+    ) -> t.List[t.Tuple[t.Any, ...]]:
+        if not binary_columns:
+            # encode_data_for_sqlite passes None through, so map() can call it on every column directly
+            return [tuple(map(encode_data_for_sqlite, row)) for row in rows]
+        # binary values are bound as BLOBs as they are, even when they happen to be valid UTF-8
+        return [
+            tuple(
+                value if index in binary_columns else encode_data_for_sqlite(value) for index, value in enumerate(row)
+            )
+            for row in rows
+        ]
+
+    def _encode_table_rows(self, table_name: str, rows: t.Iterable[t.Iterable[t.Any]]) -> t.List[t.Tuple[t.Any, ...]]:
+        return self._encode_rows(rows, self._mysql_binary_columns.get(table_name, frozenset()))
+
+    def _insert_rows(self, sql: str, rows: t.Sequence[t.Tuple[t.Any, ...]]) -> None:
+        # insert full batches as single multi-row statements and only the remainder row by row
+        batch_size, multi_row_sql = self._build_multi_row_insert_sql(sql, self._sqlite_max_variable_number)
+        batched: int = len(rows) - len(rows) % batch_size
+        for offset in range(0, batched, batch_size):
+            self._sqlite_cur.execute(multi_row_sql, tuple(chain.from_iterable(rows[offset : offset + batch_size])))
+        if batched < len(rows):
+            self._sqlite_cur.executemany(sql, rows[batched:])
+
+    def _has_unique_indices(self, table_name: str) -> bool:
+        if not self._mysql_schema_prefetched:
+            self._prefetch_mysql_schema()
+        return any(
+            index.primary in {1, "1"} or index.unique in {1, "1"}
+            for index in self._mysql_indices.get(table_name, [])
+        )
+
+    def _build_create_table_sql(self, table_name: str) -> t.Iterator[str]:
+        definitions: t.List[str] = []
+        indices: t.List[str] = []
+        deferred_indices: t.List[str] = []
+        quoted_columns_cache: t.Dict[str, str] = {}
 
         self._mysql_cur_dict.execute(f"SHOW COLUMNS FROM `{table_name}`")
         rows: t.Sequence[t.Optional[t.Dict[str, RowItemType]]] = self._mysql_cur_dict.fetchall()
 
         primary_keys: int = sum(1 for row in rows if row is not None and row["Key"] == "PRI")
+        column_names: t.List[str] = []
 
         for row in rows:
             if row is not None:
+                column_name: str = intern(self._decode_column_type(row["Field"]))  # type: ignore[arg-type]
+                column_names.append(column_name)
+                quoted_column_name: str = self._quote_sqlite_identifier(column_name)
                 column_type = self._translate_type_from_mysql_to_sqlite(
                     column_type=row["Type"],  # type: ignore[arg-type]
                     sqlite_json1_extension_enabled=self._sqlite_json1_extension_enabled,
                 )
                 if row["Key"] == "PRI" and row["Extra"] == "auto_increment" and primary_keys == 1:
                     if column_type in Integer_Types:
-                        sql += '\n\t"{name}" INTEGER PRIMARY KEY AUTOINCREMENT,'.format(
-                            name=row["Field"].decode() if isinstance(row["Field"], bytes) else row["Field"],
+                        definitions.append(
+                            "\n\t{name} INTEGER PRIMARY KEY AUTOINCREMENT".format(
+                                name=quoted_column_name,
+                            )
                         )
                     else:
                         self._logger.warning(
                             'Primary key "%s" in table "%s" is not an INTEGER type! Skipping.',
-                            row["Field"],
+                            column_name,
                             table_name,
                         )
+                elif self._collation != CollatingSequences.BINARY:
+                    definitions.append(
+                        "\n\t{name} {type} {notnull} {default} {collation}".format(
+                            name=quoted_column_name,
+                            type=column_type,
+                            notnull="NULL" if row["Null"] == "YES" else "NOT NULL",
+                            default=self._translate_default_from_mysql_to_sqlite(
+                                row["Default"], column_type, row["Extra"]
+                            ),
+                            collation=self._data_type_collation_sequence(self._collation, column_type),
+                        )
+                    )
                 else:
-                    sql += '\n\t"{name}" {type} {notnull} {default} {collation},'.format(
-                        name=row["Field"].decode() if isinstance(row["Field"], bytes) else row["Field"],
-                        type=column_type,
-                        notnull="NULL" if row["Null"] == "YES" else "NOT NULL",
-                        default=self._translate_default_from_mysql_to_sqlite(row["Default"], column_type, row["Extra"]),
-                        collation=self._data_type_collation_sequence(self._collation, column_type),
+                    definitions.append(
+                        "\n\t{name} {type} {notnull} {default}".format(
+                            name=quoted_column_name,
+                            type=column_type,
+                            notnull="NULL" if row["Null"] == "YES" else "NOT NULL",
+                            default=self._translate_default_from_mysql_to_sqlite(
+                                row["Default"], column_type, row["Extra"]
+                            ),
+                        )
                     )
 
-        self._mysql_cur_dict.execute(
-            """
-            SELECT s.INDEX_NAME AS `name`,
-                IF (NON_UNIQUE = 0 AND s.INDEX_NAME = 'PRIMARY', 1, 0) AS `primary`,
-                IF (NON_UNIQUE = 0 AND s.INDEX_NAME <> 'PRIMARY', 1, 0) AS `unique`,
-                {auto_increment}
-                GROUP_CONCAT(s.COLUMN_NAME ORDER BY SEQ_IN_INDEX) AS `columns`,
-                GROUP_CONCAT(c.COLUMN_TYPE ORDER BY SEQ_IN_INDEX) AS `types`
-            FROM information_schema.STATISTICS AS s
-            JOIN information_schema.COLUMNS AS c
-                ON s.TABLE_SCHEMA = c.TABLE_SCHEMA
-                AND s.TABLE_NAME = c.TABLE_NAME
-                AND s.COLUMN_NAME = c.COLUMN_NAME
-            WHERE s.TABLE_SCHEMA = %s
-            AND s.TABLE_NAME = %s
-            GROUP BY s.INDEX_NAME, s.NON_UNIQUE {group_by_extra}
-            """.format(
-                auto_increment=(
-                    "IF (c.EXTRA = 'auto_increment', 1, 0) AS `auto_increment`,"
-                    if primary_keys == 1
-                    else "0 as `auto_increment`,"
-                ),
-                group_by_extra=" ,c.EXTRA" if primary_keys == 1 else "",
-            ),
-            (self._mysql_database, table_name),
-        )
-        mysql_indices: t.Sequence[t.Optional[t.Dict[str, RowItemType]]] = self._mysql_cur_dict.fetchall()
-        for index in mysql_indices:
+        # remember the column names so the data transfer does not have to rebuild them from the cursor
+        self._mysql_columns[table_name] = tuple(column_names)
+
+        if not self._mysql_schema_prefetched:
+            self._prefetch_mysql_schema()
+
+        for index in self._mysql_indices.get(table_name, []):
             if index is not None:
-                index_name: str
-                if isinstance(index["name"], bytes):
-                    index_name = index["name"].decode()
-                elif isinstance(index["name"], str):
-                    index_name = index["name"]
-                else:
-                    index_name = str(index["name"])
+                index_name: str = self._decode_column_type(index.name)  # type: ignore[arg-type]
 
                 # check if the index name collides with any table name
-                self._mysql_cur_dict.execute(
-                    """
-                    SELECT COUNT(*) AS `count`
-                    FROM information_schema.TABLES
-                    WHERE TABLE_SCHEMA = %s
-                    AND TABLE_NAME = %s
-                    """,
-                    (self._mysql_database, index_name),
+                table_collision: bool = index_name.lower() in self._mysql_table_names
+
+                columns: str = (
+                    self._decode_column_type(index.columns) if isinstance(index.columns, (bytes, str)) else ""
+                )
+                types: str = (
+                    self._decode_column_type(index.types) if isinstance(index.types, (bytes, str)) else ""
                 )
-                collision: t.Optional[t.Dict[str, RowItemType]] = self._mysql_cur_dict.fetchone()
-                table_collisions: int = 0
-                if collision is not None:
-                    table_collisions = int(collision["count"])  # type: ignore[arg-type]
-
-                columns: str = ""
-                if isinstance(index["columns"], bytes):
-                    columns = index["columns"].decode()
-                elif isinstance(index["columns"], str):
-                    columns = index["columns"]
-
-                types: str = ""
-                if isinstance(index["types"], bytes):
-                    types = index["types"].decode()
-                elif isinstance(index["types"], str):
-                    types = index["types"]
 
                 if len(columns) > 0:
-                    if index["primary"] in {1, "1"}:
-                        if (index["auto_increment"] not in {1, "1"}) or any(
+                    quoted_columns: t.Optional[str] = quoted_columns_cache.get(columns)
+                    if quoted_columns is None:
+                        quoted_columns = ", ".join(
+                            self._quote_sqlite_identifier(column) for column in columns.split(",")
+                        )
+                        quoted_columns_cache[columns] = quoted_columns
+
+                    if index.primary in {1, "1"}:
+                        if primary_keys != 1 or (index.auto_increment not in {1, "1"}) or any(
                             self._translate_type_from_mysql_to_sqlite(
                                 column_type=_type,
                                 sqlite_json1_extension_enabled=self._sqlite_json1_extension_enabled,
@@ -496,141 +668,179 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
                             not in Integer_Types
                             for _type in types.split(",")
                         ):
-                            primary += "\n\tPRIMARY KEY ({columns})".format(
-                                columns=", ".join(f'"{column}"' for column in columns.split(","))
-                            )
+                            definitions.append("\n\tPRIMARY KEY ({columns})".format(columns=quoted_columns))
                     else:
-                        indices += """CREATE {unique} INDEX IF NOT EXISTS "{name}" ON "{table}" ({columns});""".format(
-                            unique="UNIQUE" if index["unique"] in {1, "1"} else "",
-                            name=(
-                                f"{table_name}_{index_name}"
-                                if (table_collisions > 0 or self._prefix_indices)
-                                else index_name
-                            ),
-                            table=table_name,
-                            columns=", ".join(f'"{column}"' for column in columns.split(",")),
+                        create_index_sql: str = (
+                            """CREATE {unique} INDEX IF NOT EXISTS {name} ON {table} ({columns});""".format(
+                                unique="UNIQUE" if index.unique in {1, "1"} else "",
+                                name=self._quote_sqlite_identifier(
+                                    f"{table_name}_{index_name}"
+                                    if (table_collision or self._prefix_indices)
+                                    else index_name
+                                ),
+                                table=self._quote_sqlite_identifier(table_name),
+                                columns=quoted_columns,
+                            )
                         )
-
-        sql += primary
-        sql = sql.rstrip(", ")
+                        if index.unique in {1, "1"}:
+                            # unique indices have to exist while inserting, so INSERT OR IGNORE can skip duplicates
+                            indices.append(create_index_sql)
+                        else:
+                            deferred_indices.append(create_index_sql)
 
         if not self._without_tables and not self._without_foreign_keys:
-            server_version: t.Optional[t.Tuple[int, ...]] = self._mysql.get_server_version()
-            self._mysql_cur_dict.execute(
-                """
-                SELECT k.COLUMN_NAME AS `column`,
-                       k.REFERENCED_TABLE_NAME AS `ref_table`,
-                       k.REFERENCED_COLUMN_NAME AS `ref_column`,
-                       c.UPDATE_RULE AS `on_update`,
-                       c.DELETE_RULE AS `on_delete`
-                FROM information_schema.TABLE_CONSTRAINTS AS i
-                {JOIN} information_schema.KEY_COLUMN_USAGE AS k
-                    ON i.CONSTRAINT_NAME = k.CONSTRAINT_NAME
-                    AND i.TABLE_NAME = k.TABLE_NAME
-                {JOIN} information_schema.REFERENTIAL_CONSTRAINTS AS c
-                    ON c.CONSTRAINT_NAME = i.CONSTRAINT_NAME
-                    AND c.TABLE_NAME = i.TABLE_NAME
-                WHERE i.TABLE_SCHEMA = %s
-                AND i.TABLE_NAME = %s
-                AND i.CONSTRAINT_TYPE = %s
-                GROUP BY i.CONSTRAINT_NAME,
-                         k.COLUMN_NAME,
-                         k.REFERENCED_TABLE_NAME,
-                         k.REFERENCED_COLUMN_NAME,
-                         c.UPDATE_RULE,
-                         c.DELETE_RULE
-                """.format(
-                    JOIN=(
-                        "JOIN"
-                        if (server_version is not None and server_version[0] == 8 and server_version[2] > 19)
-                        else "LEFT JOIN"
-                    )
-                ),
-                (self._mysql_database, table_name, "FOREIGN KEY"),
-            )
-            for foreign_key in self._mysql_cur_dict.fetchall():
+            for foreign_key in self._mysql_foreign_keys.get(table_name, []):
                 if foreign_key is not None:
-                    sql += (
-                        ',\n\tFOREIGN KEY("{column}") REFERENCES "{ref_table}" ("{ref_column}") '
-                        "ON UPDATE {on_update} "
-                        "ON DELETE {on_delete}".format(**foreign_key)  # type: ignore[str-bytes-safe]
+                    column, ref_table, ref_column, on_update, on_delete = (
+                        self._decode_column_type(foreign_key[key])  # type: ignore[arg-type]
+                        for key in ("column", "ref_table", "ref_column", "on_update", "on_delete")
+                    )
+                    definitions.append(
+                        f"\n\tFOREIGN KEY({self._quote_sqlite_identifier(column)}) "
+                        f"REFERENCES {self._quote_sqlite_identifier(ref_table)} "
+                        f"({self._quote_sqlite_identifier(ref_column)}) "
+                        f"ON UPDATE {on_update} ON DELETE {on_delete}"
                     )
 
-        sql += "\n);"
-        sql += indices
+        # plain indices are cheaper to build once the table has been populated
+        self._sqlite_deferred_indices[table_name] = deferred_indices
+
+        # join the definitions once instead of growing the statement string column by column
+        yield "CREATE TABLE IF NOT EXISTS {table} ({definitions}\n);".format(
+            table=self._quote_sqlite_identifier(table_name), definitions=",".join(definitions)
+        )
+        yield from indices
+
+    def _create_table(self, table_name: str) -> None:
+        for attempt in range(2):
+            try:
+                if attempt > 0:
+                    self._mysql.reconnect()
+                statements: t.Iterator[str] = self._build_create_table_sql(table_name)
+                # all the MySQL reads happen before the CREATE TABLE statement is yielded
+                create_table_sql: str = next(statements)
+                self._sqlite_cur.execute("SAVEPOINT create_table")
+                try:
+                    self._sqlite_cur.execute(create_table_sql)
+                    for create_index_sql in statements:
+                        self._sqlite_cur.execute(create_index_sql)
+                except sqlite3.Error:
+                    # drop the half created table but keep the surrounding transfer transaction usable
+                    self._sqlite_cur.execute("ROLLBACK TO create_table")
+                    self._sqlite_cur.execute("RELEASE create_table")
+                    raise
+                self._sqlite_cur.execute("RELEASE create_table")
+                return
+            except mysql.connector.Error as err:
+                if err.errno == errorcode.CR_SERVER_LOST:
+                    if attempt == 0:
+                        self._logger.warning("Connection to MySQL server lost.\nAttempting to reconnect.")
+                        continue
+                    self._logger.warning("Connection to MySQL server lost.\nReconnection attempt aborted.")
+                    raise
+                self._logger.error(
+                    "MySQL failed reading table definition from table %s: %s",
+                    table_name,
+                    err,
+                )
+                raise
+            except sqlite3.Error as err:
+                self._logger.error("SQLite failed creating table %s: %s", table_name, err)
+                raise
+
+    def _create_deferred_indices(self, table_name: str) -> None:
+        statements: t.List[str] = self._sqlite_deferred_indices.pop(table_name, [])
+        if not statements:
+            return
+        try:
+            self._sqlite_cur.execute("SAVEPOINT create_indices")
+            for create_index_sql in statements:
+                self._sqlite_cur.execute(create_index_sql)
+            self._sqlite_cur.execute("RELEASE create_indices")
+        except sqlite3.Error as err:
+            self._logger.error("SQLite failed creating indices on table %s: %s", table_name, err)
+            raise
+
+    def _progress_bar(self, total: int, initial: int = 0) -> tqdm:
+        # redraw at most twice a second, small chunks would otherwise redraw it on nearly every update
+        return tqdm(total=total or None, initial=initial, disable=self._quiet, mininterval=0.5, smoothing=0)
 
-        return sql
+    def _select_table_data(self, table_name: str) -> None:
+        self._mysql_cur.execute(
+            "SELECT * FROM `{table_name}` {limit}".format(
+                table_name=table_name,
+                limit=f"LIMIT {self._limit_rows}" if self._limit_rows > 0 else "",
+            )
+        )
 
-    def _create_table(self, table_name: str, attempting_reconnect: bool = False) -> None:
+    def _read_table_data(self, table_name: str, sql: str, total_records: int = 0) -> None:
+        if self._chunk_size is not None and self._chunk_size > 0:
+            chunk_size: int = self._chunk_size
+            # total_records may only be an estimate, so read until MySQL runs out of rows
+            with self._progress_bar(int(ceil(total_records / chunk_size)), self._current_chunk_number) as progress:
+                for rows in iter(lambda: self._mysql_cur.fetchmany(chunk_size), []):
+                    self._insert_rows(sql, self._encode_table_rows(table_name, rows))
+                    self._current_chunk_number += 1
+                    progress.update()
+        else:
+            with self._progress_bar(total_records) as progress:
+                # the C extension cursor ignores arraysize, so always ask for the batch size explicitly
+                for rows in iter(lambda: self._mysql_cur.fetchmany(self.MYSQL_FETCH_SIZE), []):
+                    self._insert_rows(sql, self._encode_table_rows(table_name, rows))
+                    progress.update(len(rows))
+
+    def _transfer_table_data(self, table_name: str, sql: str, total_records: int = 0) -> None:
+        self._sqlite_cur.execute("SAVEPOINT transfer_table_data")
         try:
-            if attempting_reconnect:
+            try:
+                self._read_table_data(table_name, sql, total_records)
+            except mysql.connector.Error as err:
+                if err.errno != errorcode.CR_SERVER_LOST:
+                    raise
+                self._logger.warning("Connection to MySQL server lost.\nAttempting to reconnect.")
+                # a plain SELECT has no stable order to resume from, so discard the rows and read the table again
+                self._sqlite_cur.execute("ROLLBACK TO transfer_table_data")
+                self._current_chunk_number = 0
                 self._mysql.reconnect()
-            self._sqlite_cur.executescript(self._build_create_table_sql(table_name))
-            self._sqlite.commit()
-        except mysql.connector.Error as err:
-            if err.errno == errorcode.CR_SERVER_LOST:
-                if not attempting_reconnect:
-                    self._logger.warning("Connection to MySQL server lost.\nAttempting to reconnect.")
-                    self._create_table(table_name, True)
-                else:
-                    self._logger.warning("Connection to MySQL server lost.\nReconnection attempt aborted.")
+                self._select_table_data(table_name)
+                try:
+                    self._read_table_data(table_name, sql, total_records)
+                except mysql.connector.Error as retry_err:
+                    if retry_err.errno == errorcode.CR_SERVER_LOST:
+                        self._logger.warning("Connection to MySQL server lost.\nReconnection attempt aborted.")
                     raise
+            self._sqlite_cur.execute("RELEASE transfer_table_data")
+        except mysql.connector.Error as err:
             self._logger.error(
-                "MySQL failed reading table definition from table %s: %s",
+                "MySQL transfer failed reading table data from table %s: %s",
                 table_name,
                 err,
             )
             raise
         except sqlite3.Error as err:
-            self._logger.error("SQLite failed creating table %s: %s", table_name, err)
+            self._logger.error(
+                "SQLite transfer failed inserting data into table %s: %s",
+                table_name,
+                err,
+            )
             raise
 
-    def _transfer_table_data(
-        self, table_name: str, sql: str, total_records: int = 0, attempting_reconnect: bool = False
-    ) -> None:
-        if attempting_reconnect:
-            self._mysql.reconnect()
+    def _write_table_data(self, table_name: str, readers: TableReaders, total_records: int = 0) -> None:
+        self._sqlite_cur.execute("SAVEPOINT transfer_table_data")
         try:
-            if self._chunk_size is not None and self._chunk_size > 0:
-                for chunk in trange(
-                    self._current_chunk_number,
-                    int(ceil(total_records / self._chunk_size)),
-                    disable=self._quiet,
-                ):
-                    self._current_chunk_number = chunk
-                    self._sqlite_cur.executemany(
-                        sql,
-                        (
-                            tuple(encode_data_for_sqlite(col) if col is not None else None for col in row)
-                            for row in self._mysql_cur.fetchmany(self._chunk_size)
-                        ),
-                    )
-            else:
-                self._sqlite_cur.executemany(
-                    sql,
-                    (
-                        tuple(encode_data_for_sqlite(col) if col is not None else None for col in row)
-                        for row in tqdm(
-                            self._mysql_cur.fetchall(),
-                            total=total_records,
-                            disable=self._quiet,
-                        )
-                    ),
-                )
-            self._sqlite.commit()
+            # the column names always come first, even when the table definition already provided them
+            read_columns: t.Tuple[str, ...] = readers.columns(table_name)
+            sql = self._build_insert_sql(
+                table_name,
+                self._mysql_columns.get(table_name) or read_columns,
+                or_ignore=self._without_tables or self._has_unique_indices(table_name),
+            )
+            with self._progress_bar(total_records) as progress:
+                for rows in readers.chunks(table_name):
+                    self._insert_rows(sql, rows)
+                    progress.update(len(rows))
+            self._sqlite_cur.execute("RELEASE transfer_table_data")
         except mysql.connector.Error as err:
-            if err.errno == errorcode.CR_SERVER_LOST:
-                if not attempting_reconnect:
-                    self._logger.warning("Connection to MySQL server lost.\nAttempting to reconnect.")
-                    self._transfer_table_data(
-                        table_name=table_name,
-                        sql=sql,
-                        total_records=total_records,
-                        attempting_reconnect=True,
-                    )
-                else:
-                    self._logger.warning("Connection to MySQL server lost.\nReconnection attempt aborted.")
-                    raise
             self._logger.error(
                 "MySQL transfer failed reading table data from table %s: %s",
                 table_name,
@@ -665,7 +875,10 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
                 ),
                 specific_tables,
             )
-            tables: t.Iterable[RowItemType] = (row[0] for row in self._mysql_cur_prepared.fetchall())
+            tables: t.List[str] = [
+                self._decode_column_type(row[0])  # type: ignore[arg-type]
+                for row in self._mysql_cur_prepared.fetchall()
+            ]
         else:
             # transfer all tables
             self._mysql_cur.execute(
@@ -675,16 +888,44 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
                 WHERE TABLE_SCHEMA = SCHEMA()
             """
             )
-            tables = (row[0].decode() for row in self._mysql_cur.fetchall())  # type: ignore[union-attr]
+            tables = [row[0].decode() for row in self._mysql_cur.fetchall()]  # type: ignore[union-attr]
+
+        if not self._without_data and not self._mysql_schema_prefetched:
+            # the binary columns and row estimates come from the schema, so load it before the readers share it
+            self._prefetch_mysql_schema()
+
+        # read table data on separate MySQL connections while this thread writes to SQLite
+        readers: t.Optional[TableReaders] = None
+        if self._read_workers > 0 and not self._without_data:
+            readers = TableReaders(
+                connect=self._connect_to_mysql,
+                database=self._mysql_database,
+                workers=self._read_workers,
+                fetch_size=self._chunk_size or self.MYSQL_FETCH_SIZE,
+                encode_rows=self._encode_table_rows,
+                limit_rows=self._limit_rows,
+                logger=self._logger,
+            )
+            readers.start(tables)
 
         try:
             # turn off foreign key checking in SQLite while transferring data
-            self._sqlite_cur.execute("PRAGMA foreign_keys=OFF")
+            # and transfer everything in a single transaction
+            self._sqlite_cur.executescript("PRAGMA foreign_keys=OFF; BEGIN IMMEDIATE;")
+
+            total_records_counts: t.Dict[str, int] = {}
+            if not self._without_data:
+                if self._exact_count:
+                    # count the rows of all the tables in as few round trips as possible
+                    total_records_counts = self._count_table_rows(tables)
+                else:
+                    # the row estimates of information_schema only drive the progress bar
+                    total_records_counts = {
+                        table_name: min(rows, self._limit_rows) if self._limit_rows > 0 else rows
+                        for table_name, rows in self._mysql_table_rows.items()
+                    }
 
             for table_name in tables:
-                if isinstance(table_name, bytes):
-                    table_name = table_name.decode()
-
                 self._logger.info(
                     "%s%sTransferring table %s",
                     "[WITHOUT DATA] " if self._without_data else "",
@@ -697,54 +938,51 @@ class MySQLtoSQLite(MySQLtoSQLiteAttributes):
 
                 if not self._without_tables:
                     # create the table
-                    self._create_table(table_name)  # type: ignore[arg-type]
+                    self._create_table(table_name)
 
                 if not self._without_data:
                     # get the size of the data
-                    if self._limit_rows > 0:
-                        # limit to the requested number of rows
-                        self._mysql_cur_dict.execute(
-                            "SELECT COUNT(*) AS `total_records` "
-                            f"FROM (SELECT * FROM `{table_name}` LIMIT {self._limit_rows}) AS `table`"
-                        )
-                    else:
-                        # get all rows
-                        self._mysql_cur_dict.execute(f"SELECT COUNT(*) AS `total_records` FROM `{table_name}`")
-
-                    total_records: t.Optional[t.Dict[str, RowItemType]] = self._mysql_cur_dict.fetchone()
-                    if total_records is not None:
-                        total_records_count: int = int(total_records["total_records"])  # type: ignore[arg-type]
-                    else:
-                        total_records_count = 0
+                    total_records_count: int = total_records_counts.get(table_name, 0)
 
-                    # only continue if there is anything to transfer
-                    if total_records_count > 0:
-                        # populate it
-                        self._mysql_cur.execute(
-                            "SELECT * FROM `{table_name}` {limit}".format(
-                                table_name=table_name,
-                                limit=f"LIMIT {self._limit_rows}" if self._limit_rows > 0 else "",
-                            )
+                    if readers is not None and table_name in readers:
+                        # the reader thread is already streaming this table
+                        self._write_table_data(
+                            table_name=table_name,
+                            readers=readers,
+                            total_records=total_records_count,
                         )
-                        columns: t.Tuple[str, ...] = tuple(column[0] for column in self._mysql_cur.description)  # type: ignore[union-attr]
+                    # only continue if there is anything to transfer, estimated counts can be off
+                    elif total_records_count > 0 or not self._exact_count:
+                        # populate it
+                        self._select_table_data(table_name)
+                        columns: t.Optional[t.Tuple[str, ...]] = self._mysql_columns.get(table_name)
+                        if columns is None:
+                            description = self._mysql_cur.description
+                            columns = tuple(column[0] for column in description)  # type: ignore[union-attr]
                         # build the SQL string
-                        sql = """
-                            INSERT OR IGNORE
-                            INTO "{table}" ({fields})
-                            VALUES ({placeholders})
-                        """.format(
-                            table=table_name,
-                            fields=('"{}", ' * len(columns)).rstrip(" ,").format(*columns),
-                            placeholders=("?, " * len(columns)).rstrip(" ,"),
+                        sql = self._build_insert_sql(
+                            table_name,
+                            columns,
+                            # only pay for conflict handling if the table can actually conflict
+                            or_ignore=self._without_tables or self._has_unique_indices(table_name),
                         )
                         self._transfer_table_data(
-                            table_name=table_name,  # type: ignore[arg-type]
+                            table_name=table_name,
                             sql=sql,
                             total_records=total_records_count,
                         )
-        except Exception:  # pylint: disable=W0706
-            raise
+
+                if not self._without_tables:
+                    # index the table now that its data is in place
+                    self._create_deferred_indices(table_name)
+
+            self._sqlite_cur.execute("COMMIT")
         finally:
+            # the transfer did not get to COMMIT, KeyboardInterrupt included, so discard what it wrote
+            if self._sqlite.in_transaction:
+                self._sqlite_cur.execute("ROLLBACK")
+            if readers is not None:
+                readers.close()
             # re-enable foreign key checking once done transferring
             self._sqlite_cur.execute("PRAGMA foreign_keys=ON")
 
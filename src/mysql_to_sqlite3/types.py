@@ -8,6 +8,9 @@ from sqlite3 import Connection, Cursor
 import typing_extensions as tx
 from mysql.connector.abstracts import MySQLConnectionAbstract
 from mysql.connector.cursor import MySQLCursorDict, MySQLCursorPrepared, MySQLCursorRaw
+from mysql.connector.types import RowItemType
+
+from mysql_to_sqlite3.mysql_utils import MySQLIndex
 
 
 class MySQLtoSQLiteParams(tx.TypedDict):
@@ -16,6 +19,7 @@ class MySQLtoSQLiteParams(tx.TypedDict):
     buffered: t.Optional[bool]
     chunk: t.Optional[int]
     collation: t.Optional[str]
+    exact_count: t.Optional[bool]
     exclude_mysql_tables: t.Optional[t.Sequence[str]]
     json_as_text: t.Optional[bool]
     limit_rows: t.Optional[int]
@@ -31,7 +35,10 @@ class MySQLtoSQLiteParams(tx.TypedDict):
     mysql_user: str
     prefix_indices: t.Optional[bool]
     quiet: t.Optional[bool]
+    read_workers: t.Optional[int]
     sqlite_file: t.Union[str, "os.PathLike[t.Any]"]
+    sqlite_pragmas: tx.NotRequired[t.Optional[t.Dict[str, str]]]
+    sqlite_synchronous: t.Optional[str]
     vacuum: t.Optional[bool]
     without_tables: t.Optional[bool]
     without_data: t.Optional[bool]
@@ -45,28 +52,41 @@ class MySQLtoSQLiteAttributes:
     _chunk_size: t.Optional[int]
     _collation: str
     _current_chunk_number: int
+    _exact_count: bool
     _exclude_mysql_tables: t.Sequence[str]
     _json_as_text: bool
     _limit_rows: int
     _logger: Logger
     _mysql: MySQLConnectionAbstract
+    _mysql_binary_columns: t.Dict[str, t.FrozenSet[int]]
+    _mysql_columns: t.Dict[str, t.Tuple[str, ...]]
     _mysql_cur: MySQLCursorRaw
     _mysql_cur_dict: MySQLCursorDict
     _mysql_cur_prepared: MySQLCursorPrepared
     _mysql_database: str
+    _mysql_foreign_keys: t.Dict[str, t.List[t.Dict[str, RowItemType]]]
+    _mysql_foreign_keys_join: str
+    _mysql_indices: t.Dict[str, t.List[MySQLIndex]]
     _mysql_host: str
     _mysql_password: t.Optional[str]
     _mysql_port: int
+    _mysql_schema_prefetched: bool
     _mysql_charset: str
     _mysql_collation: str
     _mysql_ssl_disabled: bool
+    _mysql_table_names: t.Set[str]
+    _mysql_table_rows: t.Dict[str, int]
     _mysql_tables: t.Sequence[str]
     _mysql_user: str
     _prefix_indices: bool
     _quiet: bool
+    _read_workers: int
     _sqlite: Connection
     _sqlite_cur: Cursor
+    _sqlite_deferred_indices: t.Dict[str, t.List[str]]
     _sqlite_file: t.Union[str, "os.PathLike[t.Any]"]
+    _sqlite_max_variable_number: int
+    _sqlite_pragmas: t.Dict[str, str]
     _without_tables: bool
     _sqlite_json1_extension_enabled: bool
     _vacuum: bool
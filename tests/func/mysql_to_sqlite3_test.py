@@ -1320,3 +1320,89 @@ class TestMySQLtoSQLite:
         sqlite_cnx.close()
         mysql_engine.dispose()
         sqlite_engine.dispose()
+
+    @pytest.mark.transfer
+    @pytest.mark.parametrize(
+        "read_workers",
+        [
+            pytest.param(0, id="serial"),
+            pytest.param(2, id="read workers"),
+        ],
+    )
+    def test_transfer_keeps_binary_values_as_blobs(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_database: Database,
+        mysql_credentials: MySQLCredentials,
+        read_workers: int,
+    ) -> None:
+        mysql_engine: Engine = create_engine(
+            f"mysql+mysqldb://{mysql_credentials.user}:{mysql_credentials.password}@{mysql_credentials.host}:{mysql_credentials.port}/{mysql_credentials.database}"
+        )
+        with mysql_engine.begin() as mysql_cnx:
+            mysql_cnx.execute(
+                text(
+                    """
+                    CREATE TABLE `binary_values` (
+                        `id` INT NOT NULL PRIMARY KEY,
+                        `blob_field` BLOB NULL,
+                        `varbinary_field` VARBINARY(32) NULL,
+                        `text_bin_field` VARCHAR(32) COLLATE utf8mb4_bin NULL
+                    )
+                    """
+                )
+            )
+            mysql_cnx.execute(
+                text("INSERT INTO `binary_values` VALUES (:id, :blob_field, :varbinary_field, :text_bin_field)"),
+                [
+                    # valid UTF-8 must not turn binary values into TEXT
+                    {"id": 1, "blob_field": b"lorem", "varbinary_field": b"ipsum", "text_bin_field": "dolor"},
+                    {"id": 2, "blob_field": b"\xff\x00", "varbinary_field": b"\x80", "text_bin_field": "sit"},
+                    {"id": 3, "blob_field": None, "varbinary_field": None, "text_bin_field": None},
+                ],
+            )
+
+        try:
+            proc: MySQLtoSQLite = MySQLtoSQLite(  # type: ignore[call-arg]
+                sqlite_file=sqlite_database,
+                mysql_user=mysql_credentials.user,
+                mysql_password=mysql_credentials.password,
+                mysql_database=mysql_credentials.database,
+                mysql_host=mysql_credentials.host,
+                mysql_port=mysql_credentials.port,
+                mysql_tables=["binary_values"],
+                read_workers=read_workers,
+                quiet=True,
+            )
+            try:
+                proc.transfer()
+            finally:
+                # release the metadata lock of the transfer's open MySQL transaction before dropping the table
+                proc._mysql.close()
+        finally:
+            with mysql_engine.begin() as mysql_cnx:
+                mysql_cnx.execute(text("DROP TABLE `binary_values`"))
+            mysql_engine.dispose()
+
+        sqlite_engine: Engine = create_engine(f"sqlite:///{sqlite_database}")
+        sqlite_cnx: Connection = sqlite_engine.connect()
+        assert [
+            tuple(row)
+            for row in sqlite_cnx.execute(
+                text(
+                    """
+                    SELECT typeof(blob_field), blob_field,
+                        typeof(varbinary_field), varbinary_field,
+                        typeof(text_bin_field), text_bin_field
+                    FROM binary_values
+                    ORDER BY id
+                    """
+                )
+            )
+        ] == [
+            ("blob", b"lorem", "blob", b"ipsum", "text", "dolor"),
+            ("blob", b"\xff\x00", "blob", b"\x80", "text", "sit"),
+            ("null", None, "null", None, "null", None),
+        ]
+        sqlite_cnx.close()
+        sqlite_engine.dispose()
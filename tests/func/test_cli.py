@@ -7,7 +7,7 @@ import pytest
 from click.testing import CliRunner, Result
 from faker import Faker
 from pytest_mock import MockFixture
-from sqlalchemy import Connection, Engine, Inspector, create_engine, inspect
+from sqlalchemy import Connection, Engine, Inspector, create_engine, inspect, text
 
 from mysql_to_sqlite3 import MySQLtoSQLite
 from mysql_to_sqlite3 import __version__ as package_version
@@ -556,6 +556,79 @@ class TestMySQLtoSQLite:
         )
         assert result.exit_code == 0
 
+    @pytest.mark.parametrize(
+        "exact_count, limit_rows",
+        [
+            pytest.param(False, None, id="estimated counts"),
+            pytest.param(False, 5, id="estimated counts, limit rows"),
+            pytest.param(True, None, id="exact counts"),
+            pytest.param(True, 5, id="exact counts, limit rows"),
+        ],
+    )
+    def test_exact_count(
+        self,
+        cli_runner: CliRunner,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_credentials: MySQLCredentials,
+        mysql_database: Database,
+        mocker: MockFixture,
+        exact_count: bool,
+        limit_rows: t.Optional[int],
+    ) -> None:
+        mysql_engine: Engine = create_engine(
+            f"mysql+mysqldb://{mysql_credentials.user}:{mysql_credentials.password}@{mysql_credentials.host}:{mysql_credentials.port}/{mysql_credentials.database}"
+        )
+        mysql_cnx: Connection = mysql_engine.connect()
+        mysql_tables: t.List[str] = inspect(mysql_engine).get_table_names()
+        mysql_counts: t.Dict[str, int] = {}
+        for table_name in mysql_tables:
+            count: int = mysql_cnx.execute(text(f"SELECT COUNT(*) FROM `{table_name}`")).scalar_one()
+            mysql_counts[table_name] = min(count, limit_rows) if limit_rows else count
+        count_table_rows = mocker.spy(MySQLtoSQLite, "_count_table_rows")
+
+        arguments: t.List[str] = [
+            "-f",
+            str(sqlite_database),
+            "-d",
+            mysql_credentials.database,
+            "-u",
+            mysql_credentials.user,
+            "--mysql-password",
+            mysql_credentials.password,
+            "-h",
+            mysql_credentials.host,
+            "-P",
+            str(mysql_credentials.port),
+        ]
+        if exact_count:
+            arguments.append("--exact-count")
+        if limit_rows:
+            arguments.extend(["--limit-rows", str(limit_rows)])
+        result: Result = cli_runner.invoke(mysql2sqlite, arguments)
+        assert result.exit_code == 0
+
+        if exact_count:
+            # the batched UNION ALL query has to agree with a plain COUNT(*) per table
+            count_table_rows.assert_called_once()
+            assert count_table_rows.spy_return == mysql_counts
+        else:
+            count_table_rows.assert_not_called()
+
+        sqlite_engine: Engine = create_engine(f"sqlite:///{sqlite_database}")
+        sqlite_cnx: Connection = sqlite_engine.connect()
+        for table_name, mysql_count in mysql_counts.items():
+            assert sqlite_cnx.execute(text(f'SELECT COUNT(*) FROM "{table_name}"')).scalar_one() == mysql_count
+
+        sqlite_cnx.close()
+        sqlite_engine.dispose()
+        mysql_cnx.close()
+        mysql_engine.dispose()
+
+    def test_sqlite_synchronous_choices_match_the_transporter(self, cli_runner: CliRunner) -> None:
+        result: Result = cli_runner.invoke(mysql2sqlite, ["--help"])
+        assert result.exit_code == 0
+        assert "[{}]".format("|".join(MySQLtoSQLite.SQLITE_SYNCHRONOUS_MODES)) in result.output
+
     @pytest.mark.xfail
     def test_version(self, cli_runner: CliRunner) -> None:
         result = cli_runner.invoke(mysql2sqlite, ["--version"])
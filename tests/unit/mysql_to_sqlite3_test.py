@@ -1,7 +1,10 @@
 import logging
 import os
 import sqlite3
+import sys
 import typing as t
+from datetime import date, timedelta
+from decimal import Decimal
 from random import choice
 
 import mysql.connector
@@ -13,6 +16,7 @@ from sqlalchemy import Inspector, inspect
 from sqlalchemy.dialects.mysql import __all__ as mysql_column_types
 
 from mysql_to_sqlite3 import MySQLtoSQLite
+from mysql_to_sqlite3.mysql_utils import MySQLIndex
 from mysql_to_sqlite3.sqlite_utils import CollatingSequences
 from tests.conftest import MySQLCredentials
 from tests.database import Database
@@ -127,6 +131,7 @@ class TestMySQLtoSQLiteClassmethods:
             ),
             pytest.param(r"""_utf8mb4\'[]\'""", "DEFAULT_GENERATED", "DEFAULT '[]'", id=r"""_utf8mb4\'[]\'"""),
             pytest.param(r"""_latin1\'abc\'""", "DEFAULT_GENERATED", "DEFAULT 'abc'", id=r"""_latin1\'abc\'"""),
+            pytest.param(r"""_latin1\'box\'""", "DEFAULT_GENERATED", "DEFAULT 'box'", id=r"""_latin1\'box\'"""),
             pytest.param(r"""_binary\'abc\'""", "DEFAULT_GENERATED", "DEFAULT 'abc'", id=r"""_binary\'abc\'"""),
             pytest.param(
                 r"""_latin1 X\'4D7953514C\'""",
@@ -151,12 +156,12 @@ class TestMySQLtoSQLiteClassmethods:
         )
 
     @pytest.mark.parametrize(
-        "column_default, sqlite_default_translation, sqlite_version",
+        "column_default, sqlite_default_translation, sqlite_boolean_literals",
         [
-            pytest.param(False, "DEFAULT(FALSE)", "3.23.0", id="False (NEW)"),
-            pytest.param(True, "DEFAULT(TRUE)", "3.23.0", id="True (NEW)"),
-            pytest.param(False, "DEFAULT '0'", "3.22.0", id="False (OLD)"),
-            pytest.param(True, "DEFAULT '1'", "3.22.0", id="True (OLD)"),
+            pytest.param(False, "DEFAULT(FALSE)", True, id="False (NEW)"),
+            pytest.param(True, "DEFAULT(TRUE)", True, id="True (NEW)"),
+            pytest.param(False, "DEFAULT '0'", False, id="False (OLD)"),
+            pytest.param(True, "DEFAULT '1'", False, id="True (OLD)"),
         ],
     )
     def test_translate_default_booleans_from_mysql_to_sqlite(
@@ -164,9 +169,9 @@ class TestMySQLtoSQLiteClassmethods:
         mocker: MockerFixture,
         column_default: bool,
         sqlite_default_translation: str,
-        sqlite_version: str,
+        sqlite_boolean_literals: bool,
     ) -> None:
-        mocker.patch.object(sqlite3, "sqlite_version", sqlite_version)
+        mocker.patch.object(MySQLtoSQLite, "SQLITE_BOOLEAN_LITERALS", sqlite_boolean_literals)
         assert (
             MySQLtoSQLite._translate_default_from_mysql_to_sqlite(column_default, "BOOLEAN")
             == sqlite_default_translation
@@ -329,6 +334,102 @@ class TestMySQLtoSQLiteClassmethods:
     ) -> None:
         assert MySQLtoSQLite._data_type_collation_sequence(collation, column_type) == resulting_column_collation
 
+    @pytest.mark.parametrize(
+        "column_type, decoded_column_type",
+        [
+            pytest.param("int(11)", "int(11)", id="int(11)"),
+            pytest.param(b"varchar(255)", "varchar(255)", id="b'varchar(255)'"),
+            pytest.param(b"enum('\xe9')", "enum('\xe9')", id="invalid utf-8"),
+            pytest.param(bytearray(b"varchar(255)"), "varchar(255)", id="bytearray(b'varchar(255)')"),
+        ],
+    )
+    def test_decode_column_type(self, column_type: t.Union[str, bytes, bytearray], decoded_column_type: str) -> None:
+        assert MySQLtoSQLite._decode_column_type(column_type) == decoded_column_type
+
+    @pytest.mark.parametrize(
+        "column_type, sqlite_type",
+        [
+            pytest.param(b"varchar(255)", "VARCHAR(255)", id="bytes"),
+            pytest.param(bytearray(b"varchar(255)"), "VARCHAR(255)", id="bytearray"),
+            pytest.param(bytearray(b"int(11) unsigned"), "INTEGER", id="bytearray unsigned"),
+        ],
+    )
+    def test_translate_type_from_mysql_to_sqlite_raw_column_types(
+        self, column_type: t.Union[bytes, bytearray], sqlite_type: str
+    ) -> None:
+        assert MySQLtoSQLite._translate_type_from_mysql_to_sqlite(column_type) == sqlite_type
+
+    @pytest.mark.parametrize(
+        "identifier, quoted_identifier",
+        [
+            pytest.param("id", '"id"', id="id"),
+            pytest.param("first name", '"first name"', id="first name"),
+            pytest.param('col"umn', '"col""umn"', id='col"umn'),
+        ],
+    )
+    def test_quote_sqlite_identifier(self, identifier: str, quoted_identifier: str) -> None:
+        assert MySQLtoSQLite._quote_sqlite_identifier(identifier) == quoted_identifier
+
+    @pytest.mark.parametrize(
+        "columns, or_ignore, sql",
+        [
+            pytest.param(("id",), True, 'INSERT OR IGNORE INTO "users" ("id") VALUES (?)', id="OR IGNORE"),
+            pytest.param(
+                ("id", "first name"),
+                False,
+                'INSERT INTO "users" ("id", "first name") VALUES (?, ?)',
+                id="plain",
+            ),
+        ],
+    )
+    def test_build_insert_sql(self, columns: t.Tuple[str, ...], or_ignore: bool, sql: str) -> None:
+        assert MySQLtoSQLite._build_insert_sql("users", columns, or_ignore=or_ignore) == sql
+
+    @pytest.mark.parametrize(
+        "columns, batch_size",
+        [
+            pytest.param(("id",), MySQLtoSQLite.SQLITE_INSERT_BATCH_SIZE, id="narrow table"),
+            pytest.param(
+                tuple(f"c{i}" for i in range(MySQLtoSQLite.SQLITE_MAX_VARIABLE_NUMBER // 2)), 2, id="wide table"
+            ),
+            pytest.param(
+                tuple(f"c{i}" for i in range(MySQLtoSQLite.SQLITE_MAX_VARIABLE_NUMBER)), 1, id="widest table"
+            ),
+        ],
+    )
+    def test_build_multi_row_insert_sql(self, columns: t.Tuple[str, ...], batch_size: int) -> None:
+        sql: str = MySQLtoSQLite._build_insert_sql("users", columns)
+        rows, multi_row_sql = MySQLtoSQLite._build_multi_row_insert_sql(sql)
+        assert rows == batch_size
+        assert multi_row_sql.count("?") == batch_size * len(columns)
+        assert multi_row_sql.startswith(sql.rpartition(" VALUES ")[0])
+
+    @pytest.mark.parametrize(
+        "max_variable_number, batch_size",
+        [
+            pytest.param(999, 99, id="SQLite built with the lowest limit"),
+            pytest.param(32766, MySQLtoSQLite.SQLITE_INSERT_BATCH_SIZE, id="SQLite built with the 3.32 default"),
+        ],
+    )
+    def test_build_multi_row_insert_sql_respects_the_variable_limit(
+        self, max_variable_number: int, batch_size: int
+    ) -> None:
+        sql: str = MySQLtoSQLite._build_insert_sql("users", tuple(f"c{i}" for i in range(10)))
+        rows, multi_row_sql = MySQLtoSQLite._build_multi_row_insert_sql(sql, max_variable_number)
+        assert rows == batch_size
+        assert multi_row_sql.count("?") == batch_size * 10
+
+    @pytest.mark.parametrize(
+        "binary_columns, encoded",
+        [
+            pytest.param(frozenset(), [(1, "lorem", "ipsum"), (2, None, "dolor")], id="no binary columns"),
+            pytest.param(frozenset({2}), [(1, "lorem", b"ipsum"), (2, None, b"dolor")], id="binary column"),
+        ],
+    )
+    def test_encode_rows(self, binary_columns: t.FrozenSet[int], encoded: t.List[t.Tuple[t.Any, ...]]) -> None:
+        rows: t.List[t.Tuple[t.Any, ...]] = [(1, b"lorem", b"ipsum"), (2, None, b"dolor")]
+        assert MySQLtoSQLite._encode_rows(rows, binary_columns) == encoded
+
     def test_data_type_collation_sequence_is_not_applied_on_non_textual_data_types(self) -> None:
         for column_type in (
             "BIGINT",
@@ -394,7 +495,7 @@ class TestMySQLtoSQLiteSQLExceptions:
         )
 
         class FakeSQLiteCursor:
-            def executescript(self, *args, **kwargs) -> t.Any:
+            def execute(self, *args, **kwargs) -> t.Any:
                 raise mysql.connector.Error(
                     msg="Error Code: 2013. Lost connection to MySQL server during query",
                     errno=errorcode.CR_SERVER_LOST,
@@ -441,7 +542,7 @@ class TestMySQLtoSQLiteSQLExceptions:
         )
 
         class FakeSQLiteCursor:
-            def executescript(self, statement: t.Any) -> t.Any:
+            def execute(self, statement: t.Any) -> t.Any:
                 raise mysql.connector.Error(
                     msg="Error Code: 2000. Unknown MySQL error",
                     errno=errorcode.CR_UNKNOWN_ERROR,
@@ -481,7 +582,7 @@ class TestMySQLtoSQLiteSQLExceptions:
         )
 
         class FakeSQLiteCursor:
-            def executescript(self, *args, **kwargs) -> t.Any:
+            def execute(self, *args, **kwargs) -> t.Any:
                 raise sqlite3.Error("Unknown SQLite error")
 
         mysql_inspect: Inspector = inspect(mysql_database.engine)
@@ -491,6 +592,93 @@ class TestMySQLtoSQLiteSQLExceptions:
         with pytest.raises(sqlite3.Error):
             proc._create_table(choice(mysql_tables))
 
+    def test_create_table_sqlite3_error_rolls_back_savepoint(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_database: Database,
+        mysql_credentials: MySQLCredentials,
+        mocker: MockerFixture,
+    ) -> None:
+        proc: MySQLtoSQLite = MySQLtoSQLite(  # type: ignore[call-arg]
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            quiet=True,
+        )
+
+        statements: t.List[str] = []
+
+        class FakeSQLiteCursor:
+            def execute(self, statement: str, *args, **kwargs) -> t.Any:
+                statements.append(statement)
+                if statement.startswith("CREATE TABLE"):
+                    raise sqlite3.Error("Unknown SQLite error")
+
+        mysql_inspect: Inspector = inspect(mysql_database.engine)
+        mysql_tables: t.List[str] = mysql_inspect.get_table_names()
+        mocker.patch.object(proc, "_sqlite_cur", FakeSQLiteCursor())
+        with pytest.raises(sqlite3.Error):
+            proc._create_table(choice(mysql_tables))
+        assert statements[0] == "SAVEPOINT create_table"
+        assert statements[1].startswith("CREATE TABLE")
+        assert statements[2:] == ["ROLLBACK TO create_table", "RELEASE create_table"]
+
+    def test_build_create_table_sql_quotes_identifiers(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_credentials: MySQLCredentials,
+        mocker: MockerFixture,
+    ) -> None:
+        proc: MySQLtoSQLite = MySQLtoSQLite(  # type: ignore[call-arg]
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            quiet=True,
+        )
+        mysql_cur_dict = mocker.Mock()
+        mysql_cur_dict.fetchall.return_value = [
+            {"Field": b'i"d', "Type": b"int", "Null": "NO", "Key": "PRI", "Default": None, "Extra": "auto_increment"},
+            {"Field": 'pa"rent', "Type": "int", "Null": "YES", "Key": "MUL", "Default": None, "Extra": ""},
+        ]
+        mocker.patch.object(proc, "_mysql_cur_dict", mysql_cur_dict)
+        proc._mysql_schema_prefetched = True
+        proc._mysql_table_names = {'no"des'}
+        proc._mysql_indices = {'no"des': [MySQLIndex(b'pa"rent_idx', 0, 0, 0, b'pa"rent', b"int")]}
+        proc._mysql_foreign_keys = {
+            'no"des': [
+                {
+                    "column": b'pa"rent',
+                    "ref_table": b'no"des',
+                    "ref_column": b'i"d',
+                    "on_update": "CASCADE",
+                    "on_delete": "SET NULL",
+                }
+            ]
+        }
+
+        statements: t.List[str] = list(proc._build_create_table_sql('no"des'))
+        for statement in statements + proc._sqlite_deferred_indices['no"des']:
+            proc._sqlite_cur.execute(statement)
+
+        assert statements[0].startswith('CREATE TABLE IF NOT EXISTS "no""des" (')
+        assert proc._sqlite_deferred_indices['no"des'] == [
+            'CREATE  INDEX IF NOT EXISTS "pa""rent_idx" ON "no""des" ("pa""rent");'
+        ]
+        assert [row[1] for row in proc._sqlite_cur.execute('PRAGMA table_info("no""des")')] == ['i"d', 'pa"rent']
+        assert proc._sqlite_cur.execute('PRAGMA foreign_key_list("no""des")').fetchone()[2:7] == (
+            'no"des',
+            'pa"rent',
+            'i"d',
+            "CASCADE",
+            "SET NULL",
+        )
+
     @pytest.mark.parametrize(
         "exception, quiet",
         [
@@ -551,6 +739,9 @@ class TestMySQLtoSQLiteSQLExceptions:
         )
 
         class FakeMySQLCursor:
+            def execute(self, statement: str, *args, **kwargs) -> t.Any:
+                pass
+
             def fetchall(self) -> t.Any:
                 raise exception
 
@@ -573,3 +764,372 @@ class TestMySQLtoSQLiteSQLExceptions:
 
         with pytest.raises((mysql.connector.Error, sqlite3.Error)):
             proc._transfer_table_data(table_name, sql)
+
+    def test_transfer_rolls_back_when_interrupted(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_database: Database,
+        mysql_credentials: MySQLCredentials,
+        mocker: MockerFixture,
+    ) -> None:
+        proc: MySQLtoSQLite = MySQLtoSQLite(  # type: ignore[call-arg]
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            quiet=True,
+        )
+
+        # the first table and its data are already written when the transfer gets interrupted
+        mocker.patch.object(proc, "_create_deferred_indices", side_effect=KeyboardInterrupt)
+
+        with pytest.raises(KeyboardInterrupt):
+            proc.transfer()
+
+        assert not proc._sqlite.in_transaction
+        assert proc._sqlite.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        with sqlite3.connect(sqlite_database) as sqlite_cnx:
+            assert sqlite_cnx.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall() == []
+
+
+class TestMySQLtoSQLiteTransfer:
+    @pytest.mark.parametrize(
+        "chunk, fetch_size",
+        [
+            pytest.param(None, MySQLtoSQLite.MYSQL_FETCH_SIZE, id="no chunk"),
+            pytest.param(10, 10, id="chunk"),
+        ],
+    )
+    def test_transfer_table_data_fetches_batches_of_explicit_size(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_database: Database,
+        mysql_credentials: MySQLCredentials,
+        mocker: MockerFixture,
+        chunk: t.Optional[int],
+        fetch_size: int,
+    ) -> None:
+        proc: MySQLtoSQLite = MySQLtoSQLite(  # type: ignore[call-arg]
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            chunk=chunk,
+            quiet=True,
+        )
+
+        fetchmany = mocker.Mock(side_effect=[[(b"1",), (b"2",)], []])
+        mocker.patch.object(proc, "_mysql_cur", mocker.Mock(fetchmany=fetchmany))
+        insert_rows = mocker.patch.object(proc, "_insert_rows")
+        sql: str = 'INSERT INTO "users" ("id") VALUES (?)'
+
+        proc._transfer_table_data("users", sql, total_records=2)
+
+        assert fetchmany.call_args_list == [mocker.call(fetch_size), mocker.call(fetch_size)]
+        insert_rows.assert_called_once_with(sql, [("1",), ("2",)])
+
+    def test_transfer_table_data_reads_the_table_again_after_reconnecting(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_database: Database,
+        mysql_credentials: MySQLCredentials,
+        mocker: MockerFixture,
+        caplog: LogCaptureFixture,
+    ) -> None:
+        proc: MySQLtoSQLite = MySQLtoSQLite(  # type: ignore[call-arg]
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            limit_rows=2,
+            quiet=True,
+        )
+        proc._sqlite.execute('CREATE TABLE "users" ("id" INTEGER)')
+
+        lost_connection = mysql.connector.Error(
+            msg="Error Code: 2013. Lost connection to MySQL server during query",
+            errno=errorcode.CR_SERVER_LOST,
+        )
+        # the first row is already inserted when the connection is lost
+        mysql_cur = mocker.Mock(fetchmany=mocker.Mock(side_effect=[[(b"1",)], lost_connection, [(b"1",), (b"2",)], []]))
+        mocker.patch.object(proc, "_mysql_cur", mysql_cur)
+        mysql_cnx = mocker.patch.object(proc, "_mysql")
+
+        with caplog.at_level(logging.WARNING):
+            proc._transfer_table_data("users", 'INSERT INTO "users" ("id") VALUES (?)', total_records=2)
+
+        mysql_cnx.reconnect.assert_called_once_with()
+        mysql_cur.execute.assert_called_once_with("SELECT * FROM `users` LIMIT 2")
+        assert not any(record.levelno >= logging.ERROR for record in caplog.records)
+        assert not proc._sqlite.in_transaction
+        assert proc._sqlite.execute('SELECT "id" FROM "users"').fetchall() == [(1,), (2,)]
+
+    @pytest.mark.parametrize(
+        "limit_rows, sql",
+        [
+            pytest.param(
+                0,
+                "SELECT 0 AS `position`, COUNT(*) AS `total_records` FROM `authors` "
+                "UNION ALL "
+                "SELECT 1 AS `position`, COUNT(*) AS `total_records` FROM `tags`",
+                id="no limit",
+            ),
+            pytest.param(
+                5,
+                "SELECT 0 AS `position`, COUNT(*) AS `total_records` "
+                "FROM (SELECT 1 FROM `authors` LIMIT 5) AS `table` "
+                "UNION ALL "
+                "SELECT 1 AS `position`, COUNT(*) AS `total_records` "
+                "FROM (SELECT 1 FROM `tags` LIMIT 5) AS `table`",
+                id="limit",
+            ),
+        ],
+    )
+    def test_count_table_rows_sql(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_database: Database,
+        mysql_credentials: MySQLCredentials,
+        mocker: MockerFixture,
+        limit_rows: int,
+        sql: str,
+    ) -> None:
+        proc: MySQLtoSQLite = MySQLtoSQLite(  # type: ignore[call-arg]
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            limit_rows=limit_rows,
+            quiet=True,
+        )
+
+        cursor = mocker.Mock(
+            fetchall=mocker.Mock(
+                return_value=[{"position": 0, "total_records": 3}, {"position": 1, "total_records": 0}]
+            )
+        )
+        mocker.patch.object(proc, "_mysql_cur_dict", cursor)
+
+        assert proc._count_table_rows(["authors", "tags"]) == {"authors": 3, "tags": 0}
+        cursor.execute.assert_called_once_with(sql)
+
+    @pytest.mark.parametrize(
+        "sqlite_synchronous, synchronous",
+        [
+            pytest.param(None, 1, id="default NORMAL"),
+            pytest.param("OFF", 0, id="OFF"),
+            pytest.param("normal", 1, id="lowercase normal"),
+            pytest.param("FULL", 2, id="FULL"),
+            pytest.param("extra", 3, id="lowercase extra"),
+        ],
+    )
+    def test_sqlite_synchronous_pragma_is_issued(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_database: Database,
+        mysql_credentials: MySQLCredentials,
+        sqlite_synchronous: t.Optional[str],
+        synchronous: int,
+    ) -> None:
+        proc: MySQLtoSQLite = MySQLtoSQLite(  # type: ignore[call-arg]
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            sqlite_synchronous=sqlite_synchronous,
+            quiet=True,
+        )
+
+        assert proc._sqlite.execute("PRAGMA synchronous").fetchone()[0] == synchronous
+
+    @pytest.mark.parametrize(
+        "sqlite_synchronous",
+        [
+            pytest.param("LAZY", id="unknown mode"),
+            pytest.param("OFF; DROP TABLE users", id="injected statement"),
+        ],
+    )
+    def test_invalid_sqlite_synchronous_raises_value_error(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_database: Database,
+        mysql_credentials: MySQLCredentials,
+        sqlite_synchronous: str,
+    ) -> None:
+        with pytest.raises(ValueError, match="is not a valid SQLite synchronous mode"):
+            MySQLtoSQLite(  # type: ignore[call-arg]
+                sqlite_file=sqlite_database,
+                mysql_user=mysql_credentials.user,
+                mysql_password=mysql_credentials.password,
+                mysql_database=mysql_credentials.database,
+                mysql_host=mysql_credentials.host,
+                mysql_port=mysql_credentials.port,
+                sqlite_synchronous=sqlite_synchronous,
+                quiet=True,
+            )
+
+    @pytest.mark.parametrize(
+        "sqlite_pragmas, message",
+        [
+            pytest.param({"synchronous": "bogus"}, "is not a valid SQLite synchronous mode", id="synchronous mode"),
+            pytest.param({"foreign_keys": "ON"}, "is not a supported SQLite pragma", id="unsupported name"),
+            pytest.param(
+                {"cache_size": "0; DROP TABLE users"}, "is not a valid value for the SQLite pragma", id="injected value"
+            ),
+        ],
+    )
+    def test_invalid_sqlite_pragmas_raise_value_error(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_database: Database,
+        mysql_credentials: MySQLCredentials,
+        sqlite_pragmas: t.Dict[str, str],
+        message: str,
+    ) -> None:
+        with pytest.raises(ValueError, match=message):
+            MySQLtoSQLite(  # type: ignore[call-arg]
+                sqlite_file=sqlite_database,
+                mysql_user=mysql_credentials.user,
+                mysql_password=mysql_credentials.password,
+                mysql_database=mysql_credentials.database,
+                mysql_host=mysql_credentials.host,
+                mysql_port=mysql_credentials.port,
+                sqlite_pragmas=sqlite_pragmas,
+                quiet=True,
+            )
+        assert not os.path.exists(sqlite_database)
+
+    def test_new_database_does_not_stay_in_wal_mode(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_database: Database,
+        mysql_credentials: MySQLCredentials,
+    ) -> None:
+        proc: MySQLtoSQLite = MySQLtoSQLite(  # type: ignore[call-arg]
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            quiet=True,
+        )
+        assert proc._sqlite.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+
+        proc.transfer()
+        proc._sqlite.close()
+
+        assert not os.path.exists(f"{sqlite_database}-wal")
+        sqlite_cnx: sqlite3.Connection = sqlite3.connect(sqlite_database)
+        try:
+            assert sqlite_cnx.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+            assert sqlite_cnx.execute("PRAGMA page_size").fetchone()[0] == int(
+                MySQLtoSQLite.SQLITE_PRAGMAS["page_size"]
+            )
+        finally:
+            sqlite_cnx.close()
+
+    def test_existing_database_keeps_its_journal_page_size_and_synchronous_mode(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_database: Database,
+        mysql_credentials: MySQLCredentials,
+    ) -> None:
+        sqlite_cnx: sqlite3.Connection = sqlite3.connect(sqlite_database)
+        try:
+            sqlite_cnx.execute("PRAGMA page_size=4096")
+            sqlite_cnx.execute("CREATE TABLE existing (id INTEGER)")
+            synchronous: int = sqlite_cnx.execute("PRAGMA synchronous").fetchone()[0]
+        finally:
+            sqlite_cnx.close()
+
+        proc: MySQLtoSQLite = MySQLtoSQLite(  # type: ignore[call-arg]
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            sqlite_synchronous="OFF",
+            quiet=True,
+        )
+
+        assert proc._sqlite.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        assert proc._sqlite.execute("PRAGMA page_size").fetchone()[0] == 4096
+        assert proc._sqlite.execute("PRAGMA synchronous").fetchone()[0] == synchronous
+        assert proc._sqlite.execute("PRAGMA cache_size").fetchone()[0] == int(
+            MySQLtoSQLite.SQLITE_PRAGMAS["cache_size"]
+        )
+
+    def test_insert_rows_respects_the_sqlite_variable_limit(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_database: Database,
+        mysql_credentials: MySQLCredentials,
+        mocker: MockerFixture,
+    ) -> None:
+        proc: MySQLtoSQLite = MySQLtoSQLite(  # type: ignore[call-arg]
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            quiet=True,
+        )
+        if sys.version_info >= (3, 11):
+            assert proc._sqlite_max_variable_number == proc._sqlite.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        else:
+            assert proc._sqlite_max_variable_number == MySQLtoSQLite.SQLITE_MAX_VARIABLE_NUMBER
+
+        proc._sqlite.execute('CREATE TABLE "pairs" ("a" INTEGER, "b" INTEGER)')
+        # pretend SQLite was built to allow only two rows of two columns per statement
+        proc._sqlite_max_variable_number = 4
+        cursor = mocker.Mock(wraps=proc._sqlite_cur)
+        mocker.patch.object(proc, "_sqlite_cur", cursor)
+        sql: str = MySQLtoSQLite._build_insert_sql("pairs", ("a", "b"), or_ignore=False)
+
+        proc._insert_rows(sql, [(1, 2), (3, 4), (5, 6)])
+
+        multi_row_sql: str = 'INSERT INTO "pairs" ("a", "b") VALUES (?, ?), (?, ?)'
+        cursor.execute.assert_called_once_with(multi_row_sql, (1, 2, 3, 4))
+        cursor.executemany.assert_called_once_with(sql, [(5, 6)])
+        assert proc._sqlite.execute('SELECT * FROM "pairs"').fetchall() == [(1, 2), (3, 4), (5, 6)]
+
+    def test_converters_are_registered_for_reading_the_result(
+        self,
+        sqlite_database: "os.PathLike[t.Any]",
+        mysql_database: Database,
+        mysql_credentials: MySQLCredentials,
+    ) -> None:
+        MySQLtoSQLite(  # type: ignore[call-arg]
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            quiet=True,
+        )
+
+        sqlite_cnx: sqlite3.Connection = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+        try:
+            sqlite_cnx.execute('CREATE TABLE "dates" ("day" DATE, "time" TIME, "amount" DECIMAL)')
+            sqlite_cnx.execute('INSERT INTO "dates" VALUES (?, ?, ?)', ("2020-01-05", "01:02:03", "12.50"))
+            assert sqlite_cnx.execute('SELECT * FROM "dates"').fetchone() == (
+                date(2020, 1, 5),
+                timedelta(hours=1, minutes=2, seconds=3),
+                Decimal("12.50"),
+            )
+        finally:
+            sqlite_cnx.close()
@@ -0,0 +1,87 @@
+import typing as t
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from mysql_to_sqlite3.sqlite_utils import (
+    adapt_timedelta,
+    convert_date,
+    convert_decimal,
+    convert_timedelta,
+    encode_data_for_sqlite,
+)
+
+
+class TestSQLiteUtils:
+    @pytest.mark.parametrize(
+        "value, adapted",
+        [
+            pytest.param(timedelta(0), "00:00:00", id="0"),
+            pytest.param(timedelta(hours=1, minutes=2, seconds=3), "01:02:03", id="01:02:03"),
+            pytest.param(timedelta(hours=838, minutes=59, seconds=59), "838:59:59", id="838:59:59"),
+            pytest.param(timedelta(seconds=59, microseconds=999999), "00:00:59", id="00:00:59.999999"),
+        ],
+    )
+    def test_adapt_timedelta(self, value: timedelta, adapted: str) -> None:
+        assert adapt_timedelta(value) == adapted
+
+    @pytest.mark.parametrize(
+        "value, converted",
+        [
+            pytest.param(b"00:00:00", timedelta(0), id="b'00:00:00'"),
+            pytest.param(b"01:02:03", timedelta(hours=1, minutes=2, seconds=3), id="b'01:02:03'"),
+            pytest.param("838:59:59", timedelta(hours=838, minutes=59, seconds=59), id="838:59:59"),
+            pytest.param("1h 2m 3s", timedelta(hours=1, minutes=2, seconds=3), id="1h 2m 3s"),
+        ],
+    )
+    def test_convert_timedelta(self, value: t.Union[str, bytes], converted: timedelta) -> None:
+        assert convert_timedelta(value) == converted
+
+    @pytest.mark.parametrize(
+        "value, converted",
+        [
+            pytest.param(b"2020-01-05", date(2020, 1, 5), id="b'2020-01-05'"),
+            pytest.param("2020-01-05", date(2020, 1, 5), id="2020-01-05"),
+            pytest.param("2020-01-05 12:34:56", date(2020, 1, 5), id="2020-01-05 12:34:56"),
+            pytest.param("Jan 5 2020", date(2020, 1, 5), id="Jan 5 2020"),
+        ],
+    )
+    def test_convert_date(self, value: t.Union[str, bytes], converted: date) -> None:
+        assert convert_date(value) == converted
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("not a date", id="not a date"),
+            pytest.param(b"2020-01-01garbage", id="b'2020-01-01garbage'"),
+        ],
+    )
+    def test_convert_date_invalid_value(self, value: t.Union[str, bytes]) -> None:
+        with pytest.raises(ValueError) as excinfo:
+            convert_date(value)
+        assert "DATE field contains" in str(excinfo.value)
+
+    @pytest.mark.parametrize(
+        "value, converted",
+        [
+            pytest.param(b"12.50", Decimal("12.50"), id="b'12.50'"),
+            pytest.param("12.50", Decimal("12.50"), id="12.50"),
+        ],
+    )
+    def test_convert_decimal(self, value: t.Union[str, bytes], converted: Decimal) -> None:
+        assert convert_decimal(value) == converted
+
+    @pytest.mark.parametrize(
+        "value, encoded",
+        [
+            pytest.param(b"lorem", "lorem", id="b'lorem'"),
+            pytest.param(bytearray(b"lorem"), "lorem", id="bytearray(b'lorem')"),
+            pytest.param(b"\xff\xfe", b"\xff\xfe", id="b'\\xff\\xfe'"),
+            pytest.param("lorem", "lorem", id="lorem"),
+            pytest.param(123, 123, id="123"),
+            pytest.param(None, None, id="None"),
+        ],
+    )
+    def test_encode_data_for_sqlite(self, value: t.Any, encoded: t.Any) -> None:
+        assert encode_data_for_sqlite(value) == encoded
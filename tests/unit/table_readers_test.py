@@ -0,0 +1,159 @@
+import re
+import threading
+import time
+import typing as t
+
+import mysql.connector
+import pytest
+from mysql.connector import errorcode
+
+from mysql_to_sqlite3 import MySQLtoSQLite
+from mysql_to_sqlite3.table_readers import TableReaders
+
+
+TABLES: t.Dict[str, t.List[t.Tuple[t.Any, ...]]] = {
+    "authors": [(str(i).encode(), f"author {i}".encode()) for i in range(25)],
+    "articles": [(str(i).encode(), f"article {i}".encode(), None) for i in range(40)],
+    "tags": [],
+}
+
+
+class FakeMySQLCursor:
+    def __init__(self, connection: "FakeMySQLConnection") -> None:
+        self._connection = connection
+        self._rows: t.List[t.Tuple[t.Any, ...]] = []
+        self._table_name: str = ""
+        self.description: t.Optional[t.Tuple[t.Tuple[t.Any, ...], ...]] = None
+
+    def execute(self, sql: str) -> None:
+        match: t.Optional[t.Match[str]] = re.search(r"`(\w+)`", sql)
+        assert match is not None
+        table_name: str = match.group(1)
+        self._connection.fail(table_name, "execute")
+        self._rows = list(TABLES[table_name])
+        self.description = tuple((f"c{i}",) for i in range(len(self._rows[0]) if self._rows else 1))
+        self._table_name = table_name
+
+    def fetchmany(self, size: int = 1) -> t.List[t.Tuple[t.Any, ...]]:
+        if self._rows:
+            self._connection.fail(self._table_name, "fetchmany")
+            self._connection.chunks_fetched += 1
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+
+class FakeMySQLConnection:
+    def __init__(self, failures: t.Dict[t.Tuple[str, str], t.List[t.Optional[Exception]]]) -> None:
+        self.database: t.Optional[str] = None
+        self.closed: bool = False
+        self.chunks_fetched: int = 0
+        self._failures = failures
+
+    def cursor(self, *args, **kwargs) -> FakeMySQLCursor:
+        return FakeMySQLCursor(self)
+
+    def fail(self, table_name: str, step: str) -> None:
+        errors: t.List[t.Optional[Exception]] = self._failures.get((table_name, step), [])
+        if errors:
+            error: t.Optional[Exception] = errors.pop(0)
+            if error is not None:
+                raise error
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def lost_connection() -> mysql.connector.Error:
+    return mysql.connector.Error(
+        msg="Error Code: 2013. Lost connection to MySQL server during query",
+        errno=errorcode.CR_SERVER_LOST,
+    )
+
+
+class TestTableReaders:
+    @staticmethod
+    def read_all(
+        workers: int,
+        failures: t.Optional[t.Dict[t.Tuple[str, str], t.List[t.Optional[Exception]]]] = None,
+        fetch_size: int = 10,
+    ) -> t.Tuple[t.Dict[str, t.List[t.Tuple[t.Any, ...]]], t.List[FakeMySQLConnection]]:
+        connections: t.List[FakeMySQLConnection] = []
+        lock = threading.Lock()
+
+        def connect() -> FakeMySQLConnection:
+            with lock:
+                connections.append(FakeMySQLConnection(failures if failures is not None else {}))
+                return connections[-1]
+
+        readers = TableReaders(
+            connect=connect,  # type: ignore[arg-type]
+            database="test",
+            workers=workers,
+            fetch_size=fetch_size,
+            encode_rows=lambda table_name, rows: MySQLtoSQLite._encode_rows(rows),
+        )
+        results: t.Dict[str, t.List[t.Tuple[t.Any, ...]]] = {}
+        try:
+            readers.start(TABLES)
+            for table_name in TABLES:
+                assert table_name in readers
+                readers.columns(table_name)
+                results[table_name] = [row for rows in readers.chunks(table_name) for row in rows]
+        finally:
+            readers.close()
+        return results, connections
+
+    @pytest.mark.parametrize("workers", [pytest.param(1, id="1 worker"), pytest.param(3, id="3 workers")])
+    def test_workers_read_the_same_rows_as_serial(self, workers: int) -> None:
+        results, connections = self.read_all(workers)
+        assert results == {table_name: MySQLtoSQLite._encode_rows(rows) for table_name, rows in TABLES.items()}
+        assert all(connection.closed and connection.database == "test" for connection in connections)
+
+    def test_worker_error_surfaces_and_releases_other_workers(self) -> None:
+        error = mysql.connector.Error(msg="Error Code: 2000. Unknown MySQL error", errno=errorcode.CR_UNKNOWN_ERROR)
+        with pytest.raises(mysql.connector.Error) as excinfo:
+            # a tiny fetch size keeps the other workers blocked on their full queues
+            self.read_all(3, failures={("authors", "fetchmany"): [error]}, fetch_size=1)
+        assert excinfo.value is error
+
+    def test_lost_connection_before_any_rows_is_retried(self) -> None:
+        results, connections = self.read_all(2, failures={("articles", "execute"): [lost_connection()]})
+        assert results["articles"] == MySQLtoSQLite._encode_rows(TABLES["articles"])
+        assert len(connections) == len(TABLES) + 1
+        assert all(connection.closed for connection in connections)
+
+    def test_lost_connection_after_rows_were_sent_is_not_retried(self) -> None:
+        with pytest.raises(mysql.connector.Error) as excinfo:
+            # the first chunk reaches the writer before the second fetch loses the connection
+            self.read_all(2, failures={("articles", "fetchmany"): [None, lost_connection()]})
+        assert excinfo.value.errno == errorcode.CR_SERVER_LOST
+
+    def test_workers_hold_at_most_two_chunks_each(self) -> None:
+        connections: t.List[FakeMySQLConnection] = []
+        lock = threading.Lock()
+
+        def connect() -> FakeMySQLConnection:
+            with lock:
+                connections.append(FakeMySQLConnection({}))
+                return connections[-1]
+
+        readers = TableReaders(
+            connect=connect,  # type: ignore[arg-type]
+            database="test",
+            workers=2,
+            fetch_size=1,
+            encode_rows=lambda table_name, rows: MySQLtoSQLite._encode_rows(rows),
+        )
+        try:
+            readers.start(TABLES)
+            # give the workers time to run ahead of a writer that has not consumed anything yet
+            time.sleep(0.2)
+            with lock:
+                assert len(connections) == 2
+                assert all(connection.chunks_fetched <= 2 for connection in connections)
+            readers.columns("authors")
+            assert [row for rows in readers.chunks("authors") for row in rows] == MySQLtoSQLite._encode_rows(
+                TABLES["authors"]
+            )
+        finally:
+            readers.close()